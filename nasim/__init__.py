@@ -23,7 +23,10 @@ def make_benchmark(scenario_name,
     scenario_name : str
         the name of the benchmark environment
     seed : int, optional
-        random seed to use to generate environment (default=None)
+        random seed to use to generate environment. For generated
+        benchmarks, if not None this also seeds numpy's global RNG, which
+        is used for exploit and privilege escalation outcomes
+        (default=None)
     fully_obs : bool, optional
         the observability mode of environment, if True then uses fully
         observable mode, otherwise partially observable (default=False)
@@ -33,12 +33,14 @@ actions or not:
 
 """
 
-import math
 import numpy as np
 from gymnasium import spaces
 
 from nasim.envs.utils import AccessLevel
 
+# scale used to quantize action cost and prob for equality checks and hashing
+QUANTIZE_SCALE = 1_000_000_000
+
 
 def load_action_list(scenario):
     """Load list of actions for environment for given scenario
@@ -53,25 +55,53 @@ def load_action_list(scenario):
     list
         list of all actions in environment
     """
+    # validate action definitions once up front, so individual actions can
+    # be constructed using the fast path which skips validation
+    for a_name, a_def in {**scenario.exploits, **scenario.privescs}.items():
+        assert 0 <= a_def["prob"] <= 1.0, \
+            f"Invalid probability for action {a_name}: {a_def['prob']}"
+
     action_list = []
     for address in scenario.address_space:
         action_list.append(
-            ServiceScan(address, scenario.service_scan_cost)
+            ServiceScan._make(
+                "service_scan", address, scenario.service_scan_cost
+            )
         )
         action_list.append(
-            OSScan(address, scenario.os_scan_cost)
+            OSScan._make("os_scan", address, scenario.os_scan_cost)
         )
         action_list.append(
-            SubnetScan(address, scenario.subnet_scan_cost)
+            SubnetScan._make(
+                "subnet_scan", address, scenario.subnet_scan_cost
+            )
         )
         action_list.append(
-            ProcessScan(address, scenario.process_scan_cost)
+            ProcessScan._make(
+                "process_scan", address, scenario.process_scan_cost
+            )
         )
         for e_name, e_def in scenario.exploits.items():
-            exploit = Exploit(e_name, address, **e_def)
+            exploit = Exploit._make(
+                e_name,
+                address,
+                e_def["cost"],
+                prob=e_def["prob"],
+                service=e_def["service"],
+                os=e_def["os"],
+                access=e_def["access"]
+            )
             action_list.append(exploit)
         for pe_name, pe_def in scenario.privescs.items():
-            privesc = PrivilegeEscalation(pe_name, address, **pe_def)
+            privesc = PrivilegeEscalation._make(
+                pe_name,
+                address,
+                pe_def["cost"],
+                prob=pe_def["prob"],
+                process=pe_def["process"],
+                os=pe_def["os"],
+                access=pe_def["access"]
+            )
             action_list.append(privesc)
     return action_list
 
@@ -136,6 +166,57 @@ class Action:
         self.cost = cost
         self.prob = prob
         self.req_access = req_access
+        # quantized cost and prob, used for fast equality checks and hashing
+        self._cost_q = int(round(cost * QUANTIZE_SCALE))
+        self._prob_q = int(round(prob * QUANTIZE_SCALE))
+
+    @classmethod
+    def _make(cls,
+              name,
+              target,
+              cost,
+              prob=1.0,
+              req_access=AccessLevel.USER,
+              **attrs):
+        """Construct an action of this class without calling ``__init__``.
+
+        This is a fast path for constructing many actions at once (e.g. when
+        loading the action list for a scenario). It skips the ``__init__``
+        chain and argument validation, so arguments must already be valid.
+
+        Parameters
+        ----------
+        name : str
+            name of action
+        target : (int, int)
+            address of target
+        cost : float
+            cost of performing action
+        prob : float, optional
+            probability of success for a given action (default=1.0)
+        req_access : AccessLevel, optional
+            the required access level to perform action
+            (default=AccessLevel.USER)
+        **attrs
+            any additional action class specific attributes (e.g. service,
+            os and access for an Exploit)
+
+        Returns
+        -------
+        Action
+            the new action
+        """
+        action = object.__new__(cls)
+        action.name = name
+        action.target = target
+        action.cost = cost
+        action.prob = prob
+        action.req_access = req_access
+        action._cost_q = int(round(cost * QUANTIZE_SCALE))
+        action._prob_q = int(round(prob * QUANTIZE_SCALE))
+        for attr_name, attr_val in attrs.items():
+            setattr(action, attr_name, attr_val)
+        return action
 
     def is_exploit(self):
         """Check if action is an exploit
@@ -238,7 +319,9 @@ class Action:
                 f"req_access={self.req_access}")
 
     def __hash__(self):
-        return hash(self.__str__())
+        return hash(
+            (self.target, self._cost_q, self._prob_q, self.req_access)
+        )
 
     def __eq__(self, other):
         if self is other:
@@ -247,8 +330,7 @@ class Action:
             return False
         if self.target != other.target:
             return False
-        if not (math.isclose(self.cost, other.cost)
-                and math.isclose(self.prob, other.prob)):
+        if self._cost_q != other._cost_q or self._prob_q != other._prob_q:
             return False
         return self.req_access == other.req_access
 
@@ -538,6 +620,11 @@ class NoOp(Action):
                          req_access=AccessLevel.NONE)
 
 
+# NoOp actions are all identical, so a single shared instance is used for
+# invalid parameterised actions
+_NOOP_INSTANCE = NoOp()
+
+
 class ActionResult:
     """A dataclass for storing the results of an Action.
 
@@ -575,6 +662,22 @@ class ActionResult:
         host addresses discovered for the first time by action
     """
 
+    # ActionResult is created every step, so use slots for faster
+    # construction and attribute access
+    __slots__ = (
+        "success",
+        "value",
+        "services",
+        "os",
+        "processes",
+        "access",
+        "discovered",
+        "connection_error",
+        "permission_error",
+        "undefined_error",
+        "newly_discovered"
+    )
+
     def __init__(self,
                  success,
                  value=0.0,
@@ -623,10 +726,9 @@ class ActionResult:
         self.connection_error = connection_error
         self.permission_error = permission_error
         self.undefined_error = undefined_error
-        if newly_discovered is not None:
-            self.newly_discovered = newly_discovered
-        else:
-            self.newly_discovered = {}
+        self.newly_discovered = (
+            {} if newly_discovered is None else newly_discovered
+        )
 
     def info(self):
         """Get results as dict
@@ -694,10 +796,18 @@ class FlatActionSpace(spaces.Discrete):
         -------
         Action
             Corresponding Action object
+
+        Raises
+        ------
+        TypeError
+            if action_idx is not an int (only checked when python is not
+            run with optimizations, i.e. the -O flag)
         """
-        assert isinstance(action_idx, int), \
-            ("When using flat action space, action must be an integer"
-             f" or an Action object: {action_idx} is invalid")
+        if __debug__ and not isinstance(action_idx, int):
+            raise TypeError(
+                "When using flat action space, action must be an integer"
+                f" or an Action object: {action_idx} is invalid"
+            )
         return self.actions[action_idx]
 
 
@@ -761,6 +871,9 @@ class ParameterisedActionSpace(spaces.MultiDiscrete):
         ProcessScan
     ]
 
+    # max number of action vectors to cache Action objects for
+    action_cache_size = 4096
+
     def __init__(self, scenario):
         """
         Parameters
@@ -770,6 +883,25 @@ class ParameterisedActionSpace(spaces.MultiDiscrete):
         """
         self.scenario = scenario
         self.actions = load_action_list(scenario)
+        # cache from action vector tuple to Action object, a plain dict so
+        # action space can still be pickled and deep copied
+        self._action_cache = {}
+        # scenario attributes used by get_action, bound locally to avoid
+        # scenario property lookups on every call
+        self._subnets = tuple(scenario.subnets)
+        self._scan_costs = {
+            ServiceScan: scenario.service_scan_cost,
+            OSScan: scenario.os_scan_cost,
+            SubnetScan: scenario.subnet_scan_cost,
+            ProcessScan: scenario.process_scan_cost
+        }
+        # dense lookup tables for exploit and privesc definitions
+        self._exploit_table = self._build_action_def_table(
+            scenario.exploit_map, scenario.services
+        )
+        self._privesc_table = self._build_action_def_table(
+            scenario.privesc_map, scenario.processes
+        )
 
         nvec = [
             len(self.action_types),
@@ -803,14 +935,46 @@ class ParameterisedActionSpace(spaces.MultiDiscrete):
         2. if action is an exploit and parameters do not match
            any exploit definition in the scenario description then
            a NoOp action is returned with 0 cost.
+        3. Action objects are cached, so the same Action object will be
+           returned for repeated calls with the same action vector. As with
+           the flat action space, returned actions should not be modified.
+
+        Raises
+        ------
+        TypeError
+            if action_vec is not a list, tuple or numpy array (only checked
+            when python is not run with optimizations, i.e. the -O flag)
         """
-        assert isinstance(action_vec, (list, tuple, np.ndarray)), \
-            ("When using parameterised action space, action must be an Action"
-             f" object, a list or a numpy array: {action_vec} is invalid")
-        a_class = self.action_types[action_vec[0]]
+        if __debug__ and not isinstance(action_vec, (list, tuple, np.ndarray)):
+            raise TypeError(
+                "When using parameterised action space, action must be an"
+                f" Action object, a list or a numpy array: {action_vec} is"
+                " invalid"
+            )
+        if isinstance(action_vec, np.ndarray):
+            # tolist converts to python ints in a single call
+            action_vec = action_vec.tolist()
+        action_vec = tuple(action_vec)
+        action = self._action_cache.get(action_vec)
+        if action is None:
+            action = self._get_action(action_vec)
+            if len(self._action_cache) >= self.action_cache_size:
+                # evict oldest cached action
+                del self._action_cache[next(iter(self._action_cache))]
+            self._action_cache[action_vec] = action
+        return action
+
+    def _get_action(self, action_vec):
+        """Construct Action object corresponding to action vector.
+
+        Uncached version of :func:`get_action`, expects action vector to be
+        a tuple of ints.
+        """
+        a_type, subnet, host, os_idx, srv_idx, proc_idx = action_vec
+        a_class = self.action_types[a_type]
         # need to add one to subnet to account for Internet subnet
-        subnet = action_vec[1]+1
-        host = action_vec[2] % self.scenario.subnets[subnet]
+        subnet = subnet+1
+        host = host % self._subnets[subnet]
 
         target = (subnet, host)
 
@@ -819,52 +983,50 @@ class ParameterisedActionSpace(spaces.MultiDiscrete):
             kwargs = self._get_scan_action_def(a_class)
             return a_class(target=target, **kwargs)
 
-        os = None if action_vec[3] == 0 else self.scenario.os[action_vec[3]-1]
-
         if a_class == Exploit:
             # have to make sure it is valid choice
             # and also get constant params (name, cost, prob, access)
-            service = self.scenario.services[action_vec[4]]
-            a_def = self._get_exploit_def(service, os)
+            a_def = self._get_exploit_def(srv_idx, os_idx)
         else:
             # privilege escalation
             # have to make sure it is valid choice
             # and also get constant params (name, cost, prob, access)
-            proc = self.scenario.processes[action_vec[5]]
-            a_def = self._get_privesc_def(proc, os)
+            a_def = self._get_privesc_def(proc_idx, os_idx)
 
         if a_def is None:
-            return NoOp()
+            return _NOOP_INSTANCE
         return a_class(target=target, **a_def)
 
     def _get_scan_action_def(self, a_class):
         """Get the constants for scan actions definitions """
-        if a_class == ServiceScan:
-            cost = self.scenario.service_scan_cost
-        elif a_class == OSScan:
-            cost = self.scenario.os_scan_cost
-        elif a_class == SubnetScan:
-            cost = self.scenario.subnet_scan_cost
-        elif a_class == ProcessScan:
-            cost = self.scenario.process_scan_cost
-        else:
+        if a_class not in self._scan_costs:
             raise TypeError(f"Not implemented for Action class {a_class}")
-        return {"cost": cost}
-
-    def _get_exploit_def(self, service, os):
-        """Check if exploit parameters are valid """
-        e_map = self.scenario.exploit_map
-        if service not in e_map:
-            return None
-        if os not in e_map[service]:
-            return None
-        return e_map[service][os]
-
-    def _get_privesc_def(self, proc, os):
-        """Check if privilege escalation parameters are valid """
-        pe_map = self.scenario.privesc_map
-        if proc not in pe_map:
-            return None
-        if os not in pe_map[proc]:
-            return None
-        return pe_map[proc][os]
+        return {"cost": self._scan_costs[a_class]}
+
+    def _get_exploit_def(self, service_idx, os_idx):
+        """Get exploit definition for service and OS index (where os_idx=0
+        is None), or None if exploit parameters are not valid
+        """
+        return self._exploit_table[service_idx, os_idx]
+
+    def _get_privesc_def(self, proc_idx, os_idx):
+        """Get privilege escalation definition for process and OS index
+        (where os_idx=0 is None), or None if parameters are not valid
+        """
+        return self._privesc_table[proc_idx, os_idx]
+
+    def _build_action_def_table(self, action_map, targets):
+        """Build dense (target, OS) table of action definitions from nested
+        {target: {os: action_def}} action map.
+
+        Table is indexed by target (service or process) index and OS index,
+        where OS index 0 is None, matching the parameterised action vector.
+        Entries are None for invalid parameter combinations.
+        """
+        os_options = [None] + list(self.scenario.os)
+        table = np.full((len(targets), len(os_options)), None, dtype=object)
+        for t_idx, target in enumerate(targets):
+            target_map = action_map.get(target, {})
+            for os_idx, os in enumerate(os_options):
+                table[t_idx, os_idx] = target_map.get(os, None)
+        return table
@@ -86,7 +86,8 @@ class NASimEnv(gym.Env):
         self.flat_obs = flat_obs
         self.render_mode = render_mode
 
-        self.network = Network(scenario)
+        # subnet scan discovered dicts are only used for partial observations
+        self.network = Network(scenario, scan_result_dicts=not fully_obs)
         self.current_state = State.generate_initial_state(self.network)
         self._renderer = None
         self.reset()
@@ -166,6 +167,13 @@ class NASimEnv(gym.Env):
         dict
             auxiliary information regarding step
             (see :func:`nasim.env.action.ActionResult.info`)
+
+        Notes
+        -----
+        In fully observable mode (``fully_obs=True``) the ``discovered``
+        and ``newly_discovered`` entries of the info dict are always empty
+        for subnet scans, since the observation already contains the full
+        state. Discovered hosts are still marked in the returned observation.
         """
         next_state, obs, reward, done, info = self.generative_step(
             self.current_state,
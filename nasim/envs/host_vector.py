@@ -4,12 +4,46 @@ This is the main class for storing and updating the state of a single host
 in the NASim environment.
 """
 
+from collections.abc import Mapping
+
 import numpy as np
 
 from nasim.envs.utils import AccessLevel
 from nasim.envs.action import ActionResult
 
 
+class _SliceDictView(Mapping):
+    """A read-only dict-like view of a block of features in a host vector.
+
+    Values are read from the vector on access, so creating a view does not
+    copy any feature values.
+    """
+
+    __slots__ = ("_vector", "_start", "_idx_map")
+
+    def __init__(self, vector, start, idx_map):
+        self._vector = vector
+        self._start = start
+        self._idx_map = idx_map
+
+    def __getitem__(self, key):
+        return self._vector[self._start + self._idx_map[key]]
+
+    def __iter__(self):
+        return iter(self._idx_map)
+
+    def __len__(self):
+        return len(self._idx_map)
+
+    def asdict(self):
+        """Get a copy of the view as a dict """
+        end = self._start + len(self._idx_map)
+        return dict(zip(self._idx_map, self._vector[self._start:end]))
+
+    def __repr__(self):
+        return repr(self.asdict())
+
+
 class HostVector:
     """ A Vector representation of a single host in NASim.
 
@@ -64,6 +98,14 @@ class HostVector:
     process_idx_map = {}
     # size of state for host vector (i.e. len of vector)
     state_size = None
+    # OS, service and process names in order of their index in host vector
+    _os_keys = ()
+    _service_keys = ()
+    _process_keys = ()
+    # maps from OS, service and process name to absolute position in vector
+    _os_vec_idx = {}
+    _service_vec_idx = {}
+    _process_vec_idx = {}
 
     # vector position constants
     # to be initialized
@@ -78,9 +120,32 @@ class HostVector:
     _os_start_idx = None
     _service_start_idx = None
     _process_start_idx = None
-
-    def __init__(self, vector):
+    _zero_template = None
+
+    # observe feature flags, combined with bitwise or to form mask_bits
+    OBS_ADDRESS = 1 << 0
+    OBS_COMPROMISED = 1 << 1
+    OBS_REACHABLE = 1 << 2
+    OBS_DISCOVERED = 1 << 3
+    OBS_VALUE = 1 << 4
+    OBS_DISCOVERY_VALUE = 1 << 5
+    OBS_ACCESS = 1 << 6
+    OBS_OS = 1 << 7
+    OBS_SERVICES = 1 << 8
+    OBS_PROCESSES = 1 << 9
+
+    def __init__(self, vector, address=None):
+        """
+        Parameters
+        ----------
+        vector : numpy.ndarray
+            the host vector
+        address : (int, int), optional
+            the (subnet, host) address of the host. If None the address is
+            decoded from the vector when first accessed (default=None)
+        """
         self.vector = vector
+        self._address = address
 
     @classmethod
     def vectorize(cls, host, address_space_bounds, vector=None):
@@ -96,36 +161,38 @@ class HostVector:
 
         vector[cls._subnet_address_idx + host.address[0]] = 1
         vector[cls._host_address_idx + host.address[1]] = 1
-        vector[cls._compromised_idx] = int(host.compromised)
-        vector[cls._reachable_idx] = int(host.reachable)
-        vector[cls._discovered_idx] = int(host.discovered)
-        vector[cls._value_idx] = host.value
-        vector[cls._discovery_value_idx] = host.discovery_value
-        vector[cls._access_idx] = host.access
-        for os_num, (os_key, os_val) in enumerate(host.os.items()):
-            vector[cls._get_os_idx(os_num)] = int(os_val)
-        for srv_num, (srv_key, srv_val) in enumerate(host.services.items()):
-            vector[cls._get_service_idx(srv_num)] = int(srv_val)
-        host_procs = host.processes.items()
-        for proc_num, (proc_key, proc_val) in enumerate(host_procs):
-            vector[cls._get_process_idx(proc_num)] = int(proc_val)
-        return cls(vector)
+        # compromised, reachable, discovered, value, discovery_value and
+        # access features are contiguous so can be set in one slice write
+        vector[cls._compromised_idx:cls._os_start_idx] = (
+            host.compromised,
+            host.reachable,
+            host.discovered,
+            host.value,
+            host.discovery_value,
+            host.access
+        )
+        vector[cls._os_idx_slice()] = [host.os[k] for k in cls._os_keys]
+        vector[cls._service_idx_slice()] = [
+            host.services[k] for k in cls._service_keys
+        ]
+        vector[cls._process_idx_slice()] = [
+            host.processes[k] for k in cls._process_keys
+        ]
+        return cls(vector, (host.address[0], host.address[1]))
 
     @classmethod
     def vectorize_random(cls, host, address_space_bounds, vector=None):
-        hvec = cls.vectorize(host, vector)
+        hvec = cls.vectorize(host, address_space_bounds, vector)
         # random variables
-        for srv_num in cls.service_idx_map.values():
-            srv_val = np.random.randint(0, 2)
-            hvec.vector[cls._get_service_idx(srv_num)] = srv_val
-
-        chosen_os = np.random.choice(list(cls.os_idx_map.values()))
-        for os_num in cls.os_idx_map.values():
-            hvec.vector[cls._get_os_idx(os_num)] = int(os_num == chosen_os)
-
-        for proc_num in cls.process_idx_map.values():
-            proc_val = np.random.randint(0, 2)
-            hvec.vector[cls._get_process_idx(proc_num)] = proc_val
+        hvec.vector[cls._service_idx_slice()] = np.random.randint(
+            0, 2, size=cls.num_services
+        )
+        chosen_os = np.random.randint(cls.num_os)
+        hvec.vector[cls._os_idx_slice()] = 0
+        hvec.vector[cls._get_os_idx(chosen_os)] = 1
+        hvec.vector[cls._process_idx_slice()] = np.random.randint(
+            0, 2, size=cls.num_processes
+        )
         return hvec
 
     @property
@@ -134,7 +201,7 @@ class HostVector:
 
     @compromised.setter
     def compromised(self, val):
-        self.vector[self._compromised_idx] = int(val)
+        self.vector[self._compromised_idx] = val
 
     @property
     def discovered(self):
@@ -142,7 +209,7 @@ class HostVector:
 
     @discovered.setter
     def discovered(self, val):
-        self.vector[self._discovered_idx] = int(val)
+        self.vector[self._discovered_idx] = val
 
     @property
     def reachable(self):
@@ -150,14 +217,18 @@ class HostVector:
 
     @reachable.setter
     def reachable(self, val):
-        self.vector[self._reachable_idx] = int(val)
+        self.vector[self._reachable_idx] = val
 
     @property
     def address(self):
-        return (
-            self.vector[self._subnet_address_idx_slice()].argmax(),
-            self.vector[self._host_address_idx_slice()].argmax()
-        )
+        if self._address is None:
+            # decode one-hot address from vector, this only needs to be done
+            # once since host address does not change
+            self._address = (
+                int(self.vector[self._subnet_address_idx_slice()].argmax()),
+                int(self.vector[self._host_address_idx_slice()].argmax())
+            )
+        return self._address
 
     @property
     def value(self):
@@ -173,40 +244,32 @@ class HostVector:
 
     @access.setter
     def access(self, val):
-        self.vector[self._access_idx] = int(val)
+        self.vector[self._access_idx] = val
 
     @property
     def services(self):
-        services = {}
-        for srv, srv_num in self.service_idx_map.items():
-            services[srv] = self.vector[self._get_service_idx(srv_num)]
-        return services
+        return _SliceDictView(
+            self.vector, self._service_start_idx, self.service_idx_map
+        )
 
     @property
     def os(self):
-        os = {}
-        for os_key, os_num in self.os_idx_map.items():
-            os[os_key] = self.vector[self._get_os_idx(os_num)]
-        return os
+        return _SliceDictView(self.vector, self._os_start_idx, self.os_idx_map)
 
     @property
     def processes(self):
-        processes = {}
-        for proc, proc_num in self.process_idx_map.items():
-            processes[proc] = self.vector[self._get_process_idx(proc_num)]
-        return processes
+        return _SliceDictView(
+            self.vector, self._process_start_idx, self.process_idx_map
+        )
 
     def is_running_service(self, srv):
-        srv_num = self.service_idx_map[srv]
-        return bool(self.vector[self._get_service_idx(srv_num)])
+        return bool(self.vector[self._service_vec_idx[srv]])
 
     def is_running_os(self, os):
-        os_num = self.os_idx_map[os]
-        return bool(self.vector[self._get_os_idx(os_num)])
+        return bool(self.vector[self._os_vec_idx[os]])
 
     def is_running_process(self, proc):
-        proc_num = self.process_idx_map[proc]
-        return bool(self.vector[self._get_process_idx(proc_num)])
+        return bool(self.vector[self._process_vec_idx[proc]])
 
     def perform_action(self, action):
         """Perform given action against this host
@@ -224,75 +287,97 @@ class HostVector:
             the result from the action
         """
         next_state = self.copy()
+        result = self.perform_action_into(action, next_state.vector)
+        return next_state, result
+
+    def perform_action_into(self, action, dest):
+        """Perform given action against this host, writing any changes to
+        the host state into dest.
+
+        Arguments
+        ---------
+        action : Action
+            the action to perform
+        dest : numpy.ndarray
+            vector to write the resulting state of host into. Must already
+            hold a copy of this host's state (e.g. the host's row in a copy
+            of the state tensor), since only changed features are written.
+
+        Returns
+        -------
+        ActionObservation
+            the result from the action
+        """
+        # read directly from vector using precomputed indices to avoid
+        # property and method dispatch on the hot path. Results get dict
+        # copies of the services/os/processes views, since they end up in
+        # the step info and must not change with later state updates
+        vec = self.vector
+        access = vec[self._access_idx]
         if action.is_service_scan():
-            result = ActionResult(True, 0, services=self.services)
-            return next_state, result
+            return ActionResult(True, 0, services=self.services.asdict())
 
         if action.is_os_scan():
-            return next_state, ActionResult(True, 0, os=self.os)
+            return ActionResult(True, 0, os=self.os.asdict())
 
         if action.is_exploit():
-            if self.is_running_service(action.service) and \
-               (action.os is None or self.is_running_os(action.os)):
+            if vec[self._service_vec_idx[action.service]] and \
+               (action.os is None or vec[self._os_vec_idx[action.os]]):
                 # service and os is present so exploit is successful
                 value = 0
-                next_state.compromised = True
-                if not self.access == AccessLevel.ROOT:
+                dest[self._compromised_idx] = 1
+                if not access == AccessLevel.ROOT:
                     # ensure a machine is not rewarded twice
                     # and access doesn't decrease
-                    next_state.access = action.access
+                    dest[self._access_idx] = action.access
                     if action.access == AccessLevel.ROOT:
-                        value = self.value
+                        value = vec[self._value_idx]
 
-                result = ActionResult(
+                return ActionResult(
                     True,
                     value=value,
-                    services=self.services,
-                    os=self.os,
+                    services=self.services.asdict(),
+                    os=self.os.asdict(),
                     access=action.access
                 )
-                return next_state, result
 
         # following actions are on host so require correct access
-        if not (self.compromised and action.req_access <= self.access):
-            result = ActionResult(False, 0, permission_error=True)
-            return next_state, result
+        if not (vec[self._compromised_idx] and action.req_access <= access):
+            return ActionResult(False, 0, permission_error=True)
 
         if action.is_process_scan():
-            result = ActionResult(
-                True, 0, access=self.access, processes=self.processes
+            return ActionResult(
+                True, 0, access=access, processes=self.processes.asdict()
             )
-            return next_state, result
 
         if action.is_privilege_escalation():
             has_proc = (
                 action.process is None
-                or self.is_running_process(action.process)
+                or vec[self._process_vec_idx[action.process]]
             )
             has_os = (
-                action.os is None or self.is_running_os(action.os)
+                action.os is None or vec[self._os_vec_idx[action.os]]
             )
             if has_proc and has_os:
                 # host compromised and proc and os is present
                 # so privesc is successful
                 value = 0.0
-                if not self.access == AccessLevel.ROOT:
+                if not access == AccessLevel.ROOT:
                     # ensure a machine is not rewarded twice
                     # and access doesn't decrease
-                    next_state.access = action.access
+                    dest[self._access_idx] = action.access
                     if action.access == AccessLevel.ROOT:
-                        value = self.value
-                result = ActionResult(
+                        value = vec[self._value_idx]
+                return ActionResult(
                     True,
                     value=value,
-                    processes=self.processes,
-                    os=self.os,
+                    processes=self.processes.asdict(),
+                    os=self.os.asdict(),
                     access=action.access
                 )
-                return next_state, result
 
         # action failed due to host config not meeting preconditions
-        return next_state, ActionResult(False, 0)
+        return ActionResult(False, 0)
 
     def observe(self,
                 address=False,
@@ -305,42 +390,87 @@ class HostVector:
                 services=False,
                 processes=False,
                 os=False):
-        obs = np.zeros(self.state_size, dtype=np.float32)
-        if address:
-            subnet_slice = self._subnet_address_idx_slice()
-            host_slice = self._host_address_idx_slice()
-            obs[subnet_slice] = self.vector[subnet_slice]
-            obs[host_slice] = self.vector[host_slice]
-        if compromised:
-            obs[self._compromised_idx] = self.vector[self._compromised_idx]
-        if reachable:
-            obs[self._reachable_idx] = self.vector[self._reachable_idx]
-        if discovered:
-            obs[self._discovered_idx] = self.vector[self._discovered_idx]
-        if value:
-            obs[self._value_idx] = self.vector[self._value_idx]
-        if discovery_value:
-            v = self.vector[self._discovery_value_idx]
-            obs[self._discovery_value_idx] = v
-        if access:
-            obs[self._access_idx] = self.vector[self._access_idx]
-        if os:
+        mask_bits = (
+            (self.OBS_ADDRESS if address else 0)
+            | (self.OBS_COMPROMISED if compromised else 0)
+            | (self.OBS_REACHABLE if reachable else 0)
+            | (self.OBS_DISCOVERED if discovered else 0)
+            | (self.OBS_ACCESS if access else 0)
+            | (self.OBS_VALUE if value else 0)
+            | (self.OBS_DISCOVERY_VALUE if discovery_value else 0)
+            | (self.OBS_SERVICES if services else 0)
+            | (self.OBS_PROCESSES if processes else 0)
+            | (self.OBS_OS if os else 0)
+        )
+        return self.observe_masked(mask_bits)
+
+    def observe_masked(self, mask_bits, out=None):
+        """Get observation of host features selected by mask_bits.
+
+        Parameters
+        ----------
+        mask_bits : int
+            bitwise or of the HostVector.OBS_* flags of features to observe
+        out : numpy.ndarray, optional
+            array to write observation into. Only the selected features are
+            written, all other entries are left unchanged, so this is
+            expected to be zeroed by caller. If None a new zeroed array is
+            allocated (default=None)
+
+        Returns
+        -------
+        numpy.ndarray
+            the host observation
+        """
+        if out is None:
+            out = self._zero_template.copy()
+        vec = self.vector
+        if mask_bits & self.OBS_ADDRESS:
+            idxs = slice(self._subnet_address_idx, self._compromised_idx)
+            out[idxs] = vec[idxs]
+        if mask_bits & self.OBS_COMPROMISED:
+            out[self._compromised_idx] = vec[self._compromised_idx]
+        if mask_bits & self.OBS_REACHABLE:
+            out[self._reachable_idx] = vec[self._reachable_idx]
+        if mask_bits & self.OBS_DISCOVERED:
+            out[self._discovered_idx] = vec[self._discovered_idx]
+        if mask_bits & self.OBS_VALUE:
+            out[self._value_idx] = vec[self._value_idx]
+        if mask_bits & self.OBS_DISCOVERY_VALUE:
+            out[self._discovery_value_idx] = vec[self._discovery_value_idx]
+        if mask_bits & self.OBS_ACCESS:
+            out[self._access_idx] = vec[self._access_idx]
+        if mask_bits & self.OBS_OS:
             idxs = self._os_idx_slice()
-            obs[idxs] = self.vector[idxs]
-        if services:
+            out[idxs] = vec[idxs]
+        if mask_bits & self.OBS_SERVICES:
             idxs = self._service_idx_slice()
-            obs[idxs] = self.vector[idxs]
-        if processes:
+            out[idxs] = vec[idxs]
+        if mask_bits & self.OBS_PROCESSES:
             idxs = self._process_idx_slice()
-            obs[idxs] = self.vector[idxs]
-        return obs
+            out[idxs] = vec[idxs]
+        return out
 
     def readable(self):
-        return self.get_readable(self.vector)
+        readable_dict = dict()
+        readable_dict["Address"] = self.address
+        readable_dict["Compromised"] = bool(self.compromised)
+        readable_dict["Reachable"] = bool(self.reachable)
+        readable_dict["Discovered"] = bool(self.discovered)
+        readable_dict["Value"] = self.value
+        readable_dict["Discovery Value"] = self.discovery_value
+        readable_dict["Access"] = self.access
+        for os_name in self.os_idx_map:
+            readable_dict[f"{os_name}"] = self.is_running_os(os_name)
+        for srv_name in self.service_idx_map:
+            readable_dict[f"{srv_name}"] = self.is_running_service(srv_name)
+        for proc_name in self.process_idx_map:
+            readable_dict[f"{proc_name}"] = self.is_running_process(proc_name)
+        return readable_dict
 
     def copy(self):
         vector_copy = np.copy(self.vector)
-        return HostVector(vector_copy)
+        return HostVector(vector_copy, self._address)
 
     def numpy(self):
         return self.vector
@@ -361,6 +491,18 @@ class HostVector:
             cls.service_idx_map[srv_key] = srv_num
         for proc_num, (proc_key, proc_val) in enumerate(processes.items()):
             cls.process_idx_map[proc_key] = proc_num
+        cls._os_keys = tuple(cls.os_idx_map)
+        cls._service_keys = tuple(cls.service_idx_map)
+        cls._process_keys = tuple(cls.process_idx_map)
+        cls._os_vec_idx = {
+            k: cls._get_os_idx(i) for k, i in cls.os_idx_map.items()
+        }
+        cls._service_vec_idx = {
+            k: cls._get_service_idx(i) for k, i in cls.service_idx_map.items()
+        }
+        cls._process_vec_idx = {
+            k: cls._get_process_idx(i) for k, i in cls.process_idx_map.items()
+        }
 
     @classmethod
     def _update_vector_idxs(cls):
@@ -378,6 +520,8 @@ class HostVector:
         cls._service_start_idx = cls._os_start_idx + cls.num_os
         cls._process_start_idx = cls._service_start_idx + cls.num_services
         cls.state_size = cls._process_start_idx + cls.num_processes
+        # zeroed vector copied to initialize new observations
+        cls._zero_template = np.zeros(cls.state_size, dtype=np.float32)
 
     @classmethod
     def _subnet_address_idx_slice(cls):
@@ -413,23 +557,53 @@ class HostVector:
 
     @classmethod
     def get_readable(cls, vector):
-        readable_dict = dict()
-        hvec = cls(vector)
-        readable_dict["Address"] = hvec.address
-        readable_dict["Compromised"] = bool(hvec.compromised)
-        readable_dict["Reachable"] = bool(hvec.reachable)
-        readable_dict["Discovered"] = bool(hvec.discovered)
-        readable_dict["Value"] = hvec.value
-        readable_dict["Discovery Value"] = hvec.discovery_value
-        readable_dict["Access"] = hvec.access
-        for os_name in cls.os_idx_map:
-            readable_dict[f"{os_name}"] = hvec.is_running_os(os_name)
-        for srv_name in cls.service_idx_map:
-            readable_dict[f"{srv_name}"] = hvec.is_running_service(srv_name)
-        for proc_name in cls.process_idx_map:
-            readable_dict[f"{proc_name}"] = hvec.is_running_process(proc_name)
+        return cls(vector).readable()
 
-        return readable_dict
+    @classmethod
+    def get_readable_batch(cls, vectors):
+        """Get readable dicts for a batch of host vectors.
+
+        Equivalent to calling :meth:`get_readable` on each row, but decodes
+        each feature for all hosts at once.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            2D array with a host vector in each row
+
+        Returns
+        -------
+        list[dict]
+            readable dict for each host vector, in row order
+        """
+        subnets = vectors[:, cls._subnet_address_idx_slice()].argmax(axis=1)
+        hosts = vectors[:, cls._host_address_idx_slice()].argmax(axis=1)
+        flags = vectors[:, cls._compromised_idx:cls._value_idx] != 0
+        values = vectors[:, cls._value_idx]
+        discovery_values = vectors[:, cls._discovery_value_idx]
+        access = vectors[:, cls._access_idx]
+        # OS, service and process features are contiguous and in key order
+        feature_names = cls._os_keys + cls._service_keys + cls._process_keys
+        features = vectors[:, cls._os_start_idx:cls.state_size] != 0
+
+        subnets = subnets.tolist()
+        hosts = hosts.tolist()
+        flags = flags.tolist()
+        features = features.tolist()
+        readable_dicts = []
+        for i in range(len(vectors)):
+            readable_dict = {
+                "Address": (subnets[i], hosts[i]),
+                "Compromised": flags[i][0],
+                "Reachable": flags[i][1],
+                "Discovered": flags[i][2],
+                "Value": values[i],
+                "Discovery Value": discovery_values[i],
+                "Access": access[i]
+            }
+            readable_dict.update(zip(feature_names, features[i]))
+            readable_dicts.append(readable_dict)
+        return readable_dicts
 
     @classmethod
     def reset(cls):
@@ -444,11 +618,13 @@ class HostVector:
         return f"Host: {self.address}"
 
     def __hash__(self):
-        return hash(str(self.vector))
+        return hash(self.vector.tobytes())
 
     def __eq__(self, other):
         if self is other:
             return True
         if not isinstance(other, HostVector):
             return False
+        if self.vector is other.vector:
+            return True
         return np.array_equal(self.vector, other.vector)
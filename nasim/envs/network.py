@@ -1,6 +1,7 @@
 import numpy as np
 
 from nasim.envs.action import ActionResult
+from nasim.envs.host_vector import HostVector
 from nasim.envs.utils import get_minimal_hops_to_goal, min_subnet_depth, AccessLevel
 
 # column in topology adjacency matrix that represents connection between
@@ -11,26 +12,89 @@ INTERNET = 0
 class Network:
     """A computer network """
 
-    def __init__(self, scenario):
+    def __init__(self, scenario, scan_result_dicts=True):
+        """
+        Parameters
+        ----------
+        scenario : Scenario
+            the scenario defining the network
+        scan_result_dicts : bool, optional
+            whether subnet scan results should include the per host
+            discovered and newly_discovered dicts. These are only needed for
+            partially observable observations, and if False the dicts are
+            left empty and the discovered status of hosts can be read from
+            the state instead (default=True)
+        """
         self.hosts = scenario.hosts
         self.host_num_map = scenario.host_num_map
         self.subnets = scenario.subnets
         self.topology = scenario.topology
+        # boolean adjacency matrix for direct indexing of subnet connections
+        self._topo = np.asarray(self.topology) == 1
         self.firewall = scenario.firewall
         self.address_space = scenario.address_space
         self.address_space_bounds = scenario.address_space_bounds
         self.sensitive_addresses = scenario.sensitive_addresses
         self.sensitive_hosts = scenario.sensitive_hosts
+        self.scan_result_dicts = scan_result_dicts
+        # per host address, subnet and state tensor row, in address space
+        # order, used for integer indexed and vectorized updates over hosts
+        self._num_hosts = len(self.address_space)
+        self._addr_arr = np.array(self.address_space, dtype=np.int32)
+        self._host_subnets = self._addr_arr[:, 0]
+        self._host_rows = np.array(
+            [self.host_num_map[addr] for addr in self.address_space],
+            dtype=np.int32
+        )
+        # dense (src subnet, dest subnet, service) firewall tensor, with
+        # traffic within a subnet always permitted and traffic between
+        # unconnected subnets never permitted
+        self._service_idx_map = {
+            srv: i for i, srv in enumerate(scenario.services)
+        }
+        num_subnets = len(self.subnets)
+        self._fw = np.zeros(
+            (num_subnets, num_subnets, len(self._service_idx_map)),
+            dtype=bool
+        )
+        for (src, dest), services in self.firewall.items():
+            for srv in services:
+                self._fw[src, dest, self._service_idx_map[srv]] = True
+        self._fw &= self._topo[:, :, np.newaxis]
+        self._fw[np.arange(num_subnets), np.arange(num_subnets)] = True
+        # state tensor rows of sensitive hosts
+        self._sensitive_rows = np.array(
+            [self.host_num_map[addr] for addr in self.sensitive_addresses],
+            dtype=np.int32
+        )
+        # mask of hosts that are in a public subnet
+        self._public_hosts = self._topo[self._host_subnets, INTERNET]
+        # map from host address to (source host, service) mask of traffic
+        # blocked by that host's firewall, for hosts with a firewall
+        addr_idx = {addr: i for i, addr in enumerate(self.address_space)}
+        self._host_fw_blocked = {}
+        for dest_addr, host in self.hosts.items():
+            blocked = np.zeros(
+                (self._num_hosts, len(self._service_idx_map)), dtype=bool
+            )
+            for src_addr, services in host.firewall.items():
+                if src_addr not in addr_idx:
+                    continue
+                srv_idxs = [self._service_idx_map[srv] for srv in services]
+                blocked[addr_idx[src_addr], srv_idxs] = True
+            if blocked.any():
+                self._host_fw_blocked[dest_addr] = blocked
 
     def reset(self, state):
         """Reset the network state to initial state """
         next_state = state.copy()
-        for host_addr in self.address_space:
-            host = next_state.get_host(host_addr)
-            host.compromised = False
-            host.access = AccessLevel.NONE
-            host.reachable = self.subnet_public(host_addr[0])
-            host.discovered = host.reachable
+        public = self._public_hosts
+        tensor = next_state.tensor
+        rows = self._host_rows
+        tensor[rows, HostVector._compromised_idx] = 0
+        tensor[rows, HostVector._access_idx] = AccessLevel.NONE
+        tensor[rows, HostVector._reachable_idx] = public
+        tensor[rows, HostVector._discovered_idx] = public
         return next_state
 
     def perform_action(self, state, action):
@@ -49,12 +113,19 @@ class Network:
             the state after the action is performed
         ActionObservation
             the result from the action
+
+        Notes
+        -----
+        The state is only copied if the action changes it, so if the action
+        fails or has no effect the returned state is the input ``state``
+        object itself.
         """
         tgt_subnet, tgt_id = action.target
         assert 0 < tgt_subnet < len(self.subnets)
         assert tgt_id <= self.subnets[tgt_subnet]
 
-        next_state = state.copy()
+        # copy of state is deferred until it is known the state will change
+        next_state = state
 
         if action.is_noop():
             return next_state, ActionResult(True)
@@ -88,43 +159,56 @@ class Network:
             return next_state, ActionResult(False, 0.0, undefined_error=True)
 
         if action.is_subnet_scan():
-            return self._perform_subnet_scan(next_state, action)
-
-        t_host = state.get_host(action.target)
-        next_host_state, action_obs = t_host.perform_action(action)
-        next_state.update_host(action.target, next_host_state)
-        self._update(next_state, action, action_obs)
+            return self._perform_subnet_scan(state, action)
+
+        t_idx, t_host = state.get_host_and_idx(action.target)
+        if action.is_exploit() or action.is_privilege_escalation():
+            # write result directly into target host row of copied state
+            next_state = state.copy()
+            action_obs = t_host.perform_action_into(
+                action, next_state.tensor[t_idx]
+            )
+            if not action_obs.success:
+                # failed actions leave the state unchanged
+                return state, action_obs
+            self._update(next_state, action, action_obs)
+            return next_state, action_obs
+
+        # scans never change the host state
+        action_obs = t_host.perform_action_into(action, t_host.vector)
         return next_state, action_obs
 
-    def _perform_subnet_scan(self, next_state, action):
-        if not next_state.host_compromised(action.target):
+    def _perform_subnet_scan(self, state, action):
+        if not state.host_compromised(action.target):
             result = ActionResult(False, 0.0, connection_error=True)
-            return next_state, result
+            return state, result
 
-        if not next_state.host_has_access(action.target, action.req_access):
+        if not state.host_has_access(action.target, action.req_access):
             result = ActionResult(False, 0.0, permission_error=True)
-            return next_state, result
+            return state, result
 
-        discovered = {}
-        newly_discovered = {}
-        discovery_reward = 0
         target_subnet = action.target[0]
-        for h_addr in self.address_space:
-            newly_discovered[h_addr] = False
-            discovered[h_addr] = False
-            if self.subnets_connected(target_subnet, h_addr[0]):
-                host = next_state.get_host(h_addr)
-                discovered[h_addr] = True
-                if not host.discovered:
-                    newly_discovered[h_addr] = True
-                    host.discovered = True
-                    discovery_reward += host.discovery_value
+        connected = self._topo[target_subnet, self._host_subnets]
+        host_states = state.tensor[self._host_rows]
+        newly = connected & (host_states[:, HostVector._discovered_idx] == 0)
+        next_state = state
+        if newly.any():
+            next_state = state.copy()
+            next_state.tensor[
+                self._host_rows[newly], HostVector._discovered_idx
+            ] = 1
+        discovery_reward = float(
+            host_states[newly, HostVector._discovery_value_idx].sum()
+        )
+
+        if not self.scan_result_dicts:
+            return next_state, ActionResult(True, discovery_reward)
 
         obs = ActionResult(
             True,
             discovery_reward,
-            discovered=discovered,
-            newly_discovered=newly_discovered
+            discovered=dict(zip(self.address_space, connected.tolist())),
+            newly_discovered=dict(zip(self.address_space, newly.tolist()))
         )
         return next_state, obs
 
@@ -136,12 +220,10 @@ class Network:
         """Updates the reachable status of hosts on network, based on current
         state and newly exploited host
         """
-        comp_subnet = compromised_addr[0]
-        for addr in self.address_space:
-            if state.host_reachable(addr):
-                continue
-            if self.subnets_connected(comp_subnet, addr[0]):
-                state.set_host_reachable(addr)
+        connected = self._topo[compromised_addr[0], self._host_subnets]
+        state.tensor[
+            self._host_rows[connected], HostVector._reachable_idx
+        ] = 1
 
     def get_sensitive_hosts(self):
         return self.sensitive_addresses
@@ -150,15 +232,12 @@ class Network:
         return host_address in self.sensitive_addresses
 
     def subnets_connected(self, subnet_1, subnet_2):
-        return self.topology[subnet_1][subnet_2] == 1
+        return bool(self._topo[subnet_1, subnet_2])
 
     def subnet_traffic_permitted(self, src_subnet, dest_subnet, service):
-        if src_subnet == dest_subnet:
-            # in same subnet so permitted
-            return True
-        if not self.subnets_connected(src_subnet, dest_subnet):
-            return False
-        return service in self.firewall[(src_subnet, dest_subnet)]
+        return bool(
+            self._fw[src_subnet, dest_subnet, self._service_idx_map[service]]
+        )
 
     def host_traffic_permitted(self, src_addr, dest_addr, service):
         dest_host = self.hosts[dest_addr]
@@ -169,49 +248,51 @@ class Network:
         if self.subnet_public(action.target[0]):
             return True
 
-        for src_addr in self.address_space:
-            if not state.host_compromised(src_addr):
-                continue
-            if action.is_scan() and \
-               not self.subnets_connected(src_addr[0], action.target[0]):
-                continue
-            if action.is_exploit() and \
-               not self.subnet_traffic_permitted(
-                   src_addr[0], action.target[0], action.service
-               ):
-                continue
-            if state.host_has_access(src_addr, action.req_access):
-                return True
-        return False
+        tgt_subnet = action.target[0]
+        host_states = state.tensor[self._host_rows]
+        # candidate sources are compromised hosts with the required access
+        # that can reach the target subnet
+        candidates = host_states[:, HostVector._compromised_idx] != 0
+        candidates &= (
+            host_states[:, HostVector._access_idx] >= action.req_access
+        )
+        if action.is_scan():
+            candidates &= self._topo[self._host_subnets, tgt_subnet]
+        elif action.is_exploit():
+            srv_idx = self._service_idx_map[action.service]
+            candidates &= self._fw[self._host_subnets, tgt_subnet, srv_idx]
+        return bool(candidates.any())
 
     def traffic_permitted(self, state, host_addr, service):
         """Checks whether the subnet and host firewalls permits traffic to a
         given host and service, based on current set of compromised hosts on
         network.
         """
-        for src_addr in self.address_space:
-            if not state.host_compromised(src_addr) and \
-               not self.subnet_public(src_addr[0]):
-                continue
-            if not self.subnet_traffic_permitted(
-                    src_addr[0], host_addr[0], service
-            ):
-                continue
-            if self.host_traffic_permitted(src_addr, host_addr, service):
-                return True
-        return False
+        compromised = state.tensor[
+            self._host_rows, HostVector._compromised_idx
+        ] != 0
+        # only compromised hosts or hosts in public subnets can be sources
+        candidates = compromised | self._public_hosts
+        # restrict to sources whose subnet and host firewalls permit the
+        # traffic
+        srv_idx = self._service_idx_map[service]
+        candidates &= self._fw[self._host_subnets, host_addr[0], srv_idx]
+        blocked = self._host_fw_blocked.get(host_addr)
+        if blocked is not None:
+            candidates &= ~blocked[:, srv_idx]
+        return bool(candidates.any())
 
     def subnet_public(self, subnet):
-        return self.topology[subnet][INTERNET] == 1
+        return bool(self._topo[subnet, INTERNET])
 
     def get_number_of_subnets(self):
         return len(self.subnets)
 
     def all_sensitive_hosts_compromised(self, state):
-        for host_addr in self.sensitive_addresses:
-            if not state.host_has_access(host_addr, AccessLevel.ROOT):
-                return False
-        return True
+        sensitive_access = state.tensor[
+            self._sensitive_rows, HostVector._access_idx
+        ]
+        return bool((sensitive_access >= AccessLevel.ROOT).all())
 
     def get_total_sensitive_host_value(self):
         total = 0
@@ -227,11 +308,11 @@ class Network:
 
     def get_minimal_hops(self):
         return get_minimal_hops_to_goal(
-            self.topology, self.sensitive_addresses
+            self._topo, self.sensitive_addresses
         )
 
     def get_subnet_depths(self):
-        return min_subnet_depth(self.topology)
+        return min_subnet_depth(self._topo)
 
     def __str__(self):
         output = "\n--- Network ---\n"
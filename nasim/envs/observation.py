@@ -48,16 +48,27 @@ class Observation:
     _perm_error_idx = _conn_error_idx + 1
     _undef_error_idx = _perm_error_idx + 1
 
-    def __init__(self, state_shape):
+    # cached string of tensor, along with tensor bytes it was created from
+    _str_cache = None
+    _str_cache_key = None
+
+    def __init__(self, state_shape, dtype=np.float32):
         """
         Parameters
         ----------
         state_shape : (int, int)
             2D shape of the state (i.e. num_hosts, host_vector_size)
+        dtype : numpy.dtype, optional
+            data type of observation tensor. All observed features are small
+            integers, flags or host values, so a narrower type such as
+            numpy.float16 can be used to reduce memory (e.g. for storing
+            observations in a replay buffer) (default=numpy.float32)
         """
         self.obs_shape = (state_shape[0]+1, state_shape[1])
         self.aux_row = self.obs_shape[0]-1
-        self.tensor = np.zeros(self.obs_shape, dtype=np.float32)
+        self.tensor = np.zeros(self.obs_shape, dtype=dtype)
+        # view of auxiliary row, must be updated if tensor is replaced
+        self._aux_view = self.tensor[self.aux_row]
 
     @staticmethod
     def get_space_bounds(scenario):
@@ -80,24 +91,28 @@ class Observation:
 
     @classmethod
     def from_numpy(cls, o_array, state_shape):
-        obs = cls(state_shape)
-        if o_array.shape != (state_shape[0]+1, state_shape[1]):
-            o_array = o_array.reshape(state_shape[0]+1, state_shape[1])
+        # bypass __init__ since its zeroed tensor would be discarded
+        obs = cls.__new__(cls)
+        obs.obs_shape = (state_shape[0]+1, state_shape[1])
+        obs.aux_row = obs.obs_shape[0]-1
+        if o_array.shape != obs.obs_shape:
+            # returns a view, without copying, if o_array is contiguous
+            o_array = o_array.reshape(obs.obs_shape)
         obs.tensor = o_array
+        obs._aux_view = o_array[obs.aux_row]
         return obs
 
     def from_state(self, state):
         self.tensor[:self.aux_row] = state.tensor
 
     def from_action_result(self, action_result):
-        success = int(action_result.success)
-        self.tensor[self.aux_row][self._success_idx] = success
-        con_err = int(action_result.connection_error)
-        self.tensor[self.aux_row][self._conn_error_idx] = con_err
-        perm_err = int(action_result.permission_error)
-        self.tensor[self.aux_row][self._perm_error_idx] = perm_err
-        undef_err = int(action_result.undefined_error)
-        self.tensor[self.aux_row][self._undef_error_idx] = undef_err
+        # auxiliary features are contiguous so set in a single slice write
+        self._aux_view[self._success_idx:self._undef_error_idx+1] = (
+            action_result.success,
+            action_result.connection_error,
+            action_result.permission_error,
+            action_result.undefined_error
+        )
 
     def from_state_and_action(self, state, action_result):
         self.from_state(state)
@@ -115,7 +130,7 @@ class Observation:
         bool
             True if the action succeeded, otherwise False
         """
-        return bool(self.tensor[self.aux_row][self._success_idx])
+        return bool(self._aux_view[self._success_idx])
 
     @property
     def connection_error(self):
@@ -126,7 +141,7 @@ class Observation:
         bool
             True if there was a connection error, otherwise False
         """
-        return bool(self.tensor[self.aux_row][self._conn_error_idx])
+        return bool(self._aux_view[self._conn_error_idx])
 
     @property
     def permission_error(self):
@@ -137,7 +152,7 @@ class Observation:
         bool
             True if there was a permission error, otherwise False
         """
-        return bool(self.tensor[self.aux_row][self._perm_error_idx])
+        return bool(self._aux_view[self._perm_error_idx])
 
     @property
     def undefined_error(self):
@@ -148,7 +163,7 @@ class Observation:
         bool
             True if there was a undefined error, otherwise False
         """
-        return bool(self.tensor[self.aux_row][self._undef_error_idx])
+        return bool(self._aux_view[self._undef_error_idx])
 
     def shape_flat(self):
         """Get the flat (1D) shape of the Observation.
@@ -158,7 +173,7 @@ class Observation:
         (int, )
             the flattened shape of observation
         """
-        return self.numpy_flat().shape
+        return (self.tensor.size, )
 
     def shape(self):
         """Get the (2D) shape of the observation
@@ -176,9 +191,11 @@ class Observation:
         Returns
         -------
         numpy.ndarray
-            the flattened (1D) observation tenser
+            the flattened (1D) observation tenser. Like :meth:`numpy` this
+            is a view of the observation tensor (rather than a copy) when
+            the tensor is contiguous
         """
-        return self.tensor.flatten()
+        return self.tensor.ravel()
 
     def numpy(self):
         """Get the observation tensor
@@ -200,11 +217,7 @@ class Observation:
         dict[str, bool]
             auxiliary observation dictionary
         """
-        host_obs = []
-        for host_idx in range(self.obs_shape[0]-1):
-            host_obs_vec = self.tensor[host_idx]
-            readable_dict = HostVector.get_readable(host_obs_vec)
-            host_obs.append(readable_dict)
+        host_obs = HostVector.get_readable_batch(self.tensor[:self.aux_row])
 
         aux_obs = {
             "Success": self.success,
@@ -215,10 +228,18 @@ class Observation:
         return host_obs, aux_obs
 
     def __str__(self):
-        return str(self.tensor)
+        # tensor can be modified in place (including by State and users) so
+        # the cache is keyed on tensor contents, which is much cheaper to
+        # check than formatting the tensor
+        key = self.tensor.tobytes()
+        if key != self._str_cache_key:
+            self._str_cache = str(self.tensor)
+            self._str_cache_key = key
+        return self._str_cache
 
     def __eq__(self, other):
         return np.array_equal(self.tensor, other.tensor)
 
     def __hash__(self):
-        return hash(str(self.tensor))
+        # tobytes copies into C order so is valid for non-contiguous tensors
+        return hash(self.tensor.tobytes())
@@ -1,7 +1,8 @@
 """This module contains functions and classes for rendering NASim """
-import math
 import random
 import tkinter as Tk
+from itertools import combinations
+import numpy as np
 import networkx as nx
 from prettytable import PrettyTable
 
@@ -27,6 +28,11 @@ AGENT = (0, 0)
 COLORS = ['yellow', 'orange', 'magenta', 'green', 'blue', 'red', 'black']
 SYMBOLS = ['C', 'R', 'S', 'c', 'r', 'o', 'A']
 
+# index of host representation in COLORS/SYMBOLS indexed by
+# (sensitive << 2) | (compromised << 1) | reachable
+# Sensitive and compromised hosts take precedence over reachable hosts
+_REPRESENTATION_TABLE = (5, 4, 3, 3, 2, 1, 0, 0)
+
 
 class Viewer:
     """A class for visualizing the network state from NASimEnv"""
@@ -39,6 +45,7 @@ class Viewer:
             network of environment
         """
         self.network = network
+        self.sensitive_hosts_set = frozenset(network.sensitive_hosts)
         self.subnets = self._get_subnets(network)
         self.positions = self._get_host_positions(network)
 
@@ -111,7 +118,7 @@ class Viewer:
         """
         init_ep_state = episode[0][0]
         G = self._construct_graph(init_ep_state)
-        EpisodeViewer(episode, G, self.network.sensitive_hosts, width, height)
+        EpisodeViewer(episode, G, self.sensitive_hosts_set, width, height)
 
     def render_readable(self, obs):
         """Print a readable tabular version of observation to stdout
@@ -174,7 +181,7 @@ class Viewer:
             NetworkX Graph representing state of network
         """
         G = nx.Graph()
-        sensitive_hosts = self.network.sensitive_hosts
+        sensitive_hosts = self.sensitive_hosts_set
 
         # Create a fully connected graph for each subnet
         for subnet in self.subnets:
@@ -185,11 +192,7 @@ class Viewer:
                                                      COLORS)
                 node_pos = self.positions[m]
                 G.add_node(m, color=node_color, pos=node_pos, label=str(m))
-            for x in subnet:
-                for y in subnet:
-                    if x == y:
-                        continue
-                    G.add_edge(x, y)
+            G.add_edges_from(combinations(subnet, 2))
 
         # Retrieve first host in each subnet
         subnet_prime_nodes = []
@@ -197,12 +200,11 @@ class Viewer:
             subnet_prime_nodes.append(subnet[0])
         # Connect connected subnets by creating edge between first host from
         # each subnet
-        for x in subnet_prime_nodes:
-            for y in subnet_prime_nodes:
-                if x == y:
-                    continue
-                if self.network.subnets_connected(x[0], y[0]):
-                    G.add_edge(x, y)
+        topology = np.asarray(self.network.topology) == 1
+        G.add_edges_from(
+            (subnet_prime_nodes[i], subnet_prime_nodes[j])
+            for i, j in zip(*np.nonzero(topology)) if i != j
+        )
 
         return G
 
@@ -234,7 +236,10 @@ class Viewer:
         row_height = max_pos / (max_depth + 1)
 
         # positions are randomly assigned within regions of display based on
-        # subnet number
+        # subnet number. Generator is seeded from the random module so
+        # layouts follow random.seed without consuming numpy's global random
+        # state used by the environment
+        rng = np.random.default_rng(random.getrandbits(64))
         positions = {}
         for m in address_space:
             m_subnet = m[0]
@@ -253,7 +258,7 @@ class Viewer:
             # randomly sample position of host within row and column of subnet
             col_pos, row_pos = self._get_host_position(
                 m, positions, address_space, row_min, row_max, col_min,
-                col_max, margin
+                col_max, margin, rng
             )
             positions[m] = (col_pos, row_pos)
 
@@ -267,42 +272,40 @@ class Viewer:
         return positions
 
     def _get_host_position(self, m, positions, address_space, row_min, row_max,
-                           col_min, col_max, margin):
+                           col_min, col_max, margin, rng=None):
         """Get the position of m within the bounds of (row_min, row_max,
         col_min, col_max) while trying to make the distance between the
         positions of any two hosts in the same subnet greater than some
         threshold.
         """
-        subnet_hosts = []
-        for other_m in address_space:
-            if other_m == m:
-                continue
-            if other_m[0] == m[0]:
-                subnet_hosts.append(other_m)
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        subnet_positions = [
+            pos for other_m, pos in positions.items()
+            if other_m[0] == m[0] and other_m != m
+        ]
 
         threshold = 8
         col_margin = (col_max - col_min) / 4
         col_mid = col_max - ((col_max - col_min) / 2)
-        m_y = random.uniform(row_min + margin, row_max - margin)
-        m_x = random.uniform(col_mid - col_margin, col_mid + col_margin)
-
-        # only try 100 times
-        good = False
-        n = 0
-        while n < 100 and not good:
-            good = True
-            m_x = random.uniform(col_mid - col_margin, col_mid + col_margin)
-            m_y = random.uniform(row_min + margin, row_max - margin)
-            for other_m in subnet_hosts:
-                if other_m not in positions:
-                    continue
-                other_x, other_y = positions[other_m]
-                dist = math.hypot(m_x - other_x, m_y - other_y)
-                if dist < threshold:
-                    good = False
-                    break
-            n += 1
-        return m_x, m_y
+
+        # only try 100 candidate positions, sampled all at once
+        num_candidates = 100
+        m_xs = rng.uniform(
+            col_mid - col_margin, col_mid + col_margin, num_candidates
+        )
+        m_ys = rng.uniform(row_min + margin, row_max - margin, num_candidates)
+        if not subnet_positions:
+            return float(m_xs[0]), float(m_ys[0])
+
+        other_xs, other_ys = np.asarray(subnet_positions).T
+        dists = np.hypot(
+            m_xs[:, np.newaxis] - other_xs, m_ys[:, np.newaxis] - other_ys
+        )
+        good = (dists >= threshold).all(axis=1)
+        # use first good candidate, or last candidate if none are good
+        idx = int(np.argmax(good)) if good.any() else -1
+        return float(m_xs[idx]), float(m_ys[idx])
 
     def _get_subnets(self, network):
         """Get list of hosts organized into subnets
@@ -332,6 +335,17 @@ class EpisodeViewer:
         self.episode = episode
         self.G = G
         self.sensitive_hosts = sensitive_hosts
+        self.sensitive_hosts_set = frozenset(sensitive_hosts)
+        # node drawing attributes, kept in sync with graph so they don't need
+        # to be rebuilt for every frame
+        self._node_list = list(G.nodes)
+        self._node_idx = {n: i for i, n in enumerate(self._node_list)}
+        self._colors = [G.nodes[n]["color"] for n in self._node_list]
+        self._labels = {n: G.nodes[n]["label"] for n in self._node_list}
+        self._pos = {n: G.nodes[n]["pos"] for n in self._node_list}
+        # compromised and reachable flags of each host (by host number) in
+        # last drawn state, used to only update hosts that changed
+        self._prev_flags = None
         # used for moving between timesteps in episode
         self.timestep = 0
         self._setup_GUI(width, height)
@@ -385,24 +399,38 @@ class EpisodeViewer:
             self._next_graph()
 
     def _update_graph(self, G, state):
-        # update colour of each host in network as necessary
-        for m in list(G.nodes):
-            if m == AGENT:
-                continue
+        # update colour of each host in network whose compromised or reachable
+        # status has changed since last drawn state
+        flags = np.stack(
+            [state.hosts_compromised_mask(), state.hosts_reachable_mask()],
+            axis=1
+        )
+        if self._prev_flags is None:
+            # host address for each host number
+            self._row_hosts = [None] * len(state.host_num_map)
+            for m, row in state.host_num_map.items():
+                self._row_hosts[row] = m
+            changed = self._row_hosts
+        else:
+            changed_rows = np.flatnonzero(
+                (flags != self._prev_flags).any(axis=1)
+            )
+            changed = [self._row_hosts[row] for row in changed_rows]
+        self._prev_flags = flags
+
+        for m in changed:
             node_color = get_host_representation(
-                state, self.sensitive_hosts, m, COLORS
+                state, self.sensitive_hosts_set, m, COLORS
             )
-            G.nodes[m]["color"] = node_color
+            if G.nodes[m]["color"] != node_color:
+                G.nodes[m]["color"] = node_color
+                self._colors[self._node_idx[m]] = node_color
         return G
 
     def _draw_graph(self, G):
-        pos = {}
-        colors = []
-        labels = {}
-        for n in list(G.nodes):
-            colors.append(G.nodes[n]["color"])
-            labels[n] = G.nodes[n]["label"]
-            pos[n] = G.nodes[n]["pos"]
+        pos = self._pos
+        colors = self._colors
+        labels = self._labels
 
         # clear window and redraw graph
         self.axes.cla()
@@ -467,8 +495,9 @@ def get_host_representation(state, sensitive_hosts, m, representation):
     ---------
     state : State
         current state
-    sensitive_hosts : list
-        list of addresses of sensitive hosts on network
+    sensitive_hosts : set
+        set of addresses of sensitive hosts on network (any container
+        supporting membership tests, but a set or dict gives O(1) lookups)
     m : (int, int)
         host address
     representation : list
@@ -482,20 +511,9 @@ def get_host_representation(state, sensitive_hosts, m, representation):
     # agent not in state so return straight away
     if m == AGENT:
         return representation[6]
-    compromised = state.host_compromised(m)
-    reachable = state.host_reachable(m)
-    sensitive = m in sensitive_hosts
-    if sensitive:
-        if compromised:
-            output = representation[0]
-        elif reachable:
-            output = representation[1]
-        else:
-            output = representation[2]
-    elif compromised:
-        output = representation[3]
-    elif reachable:
-        output = representation[4]
-    else:
-        output = representation[5]
-    return output
+    idx = (
+        (m in sensitive_hosts) << 2
+        | bool(state.host_compromised(m)) << 1
+        | bool(state.host_reachable(m))
+    )
+    return representation[_REPRESENTATION_TABLE[idx]]
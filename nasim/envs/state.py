@@ -1,3 +1,5 @@
+import hashlib
+
 import numpy as np
 
 from nasim.envs.host_vector import HostVector
@@ -110,14 +112,18 @@ class State:
             obs.from_state(self)
             return obs
 
-        for host_addr, host in self.hosts:
+        mask_bits = (
+            HostVector.OBS_ADDRESS
+            | HostVector.OBS_REACHABLE
+            | HostVector.OBS_DISCOVERED
+        )
+        for host_addr in self.host_num_map:
+            host_idx, host = self.get_host_and_idx(host_addr)
             if not host.reachable:
                 continue
-            host_obs = host.observe(address=True,
-                                    reachable=True,
-                                    discovered=True)
-            host_idx = self.get_host_idx(host_addr)
-            obs.update_from_host(host_idx, host_obs)
+            # observation tensor is zeroed so write host observation directly
+            # into its row
+            host.observe_masked(mask_bits, out=obs.tensor[host_idx])
         return obs
 
     def get_observation(self, action, action_result, fully_obs):
@@ -151,56 +157,51 @@ class State:
             return obs
 
         t_idx, t_host = self.get_host_and_idx(action.target)
-        obs_kwargs = dict(
-            address=True,       # must be true for success
-            compromised=False,
-            reachable=True,     # must be true for success
-            discovered=True,    # must be true for success
-            value=False,
-            # discovery_value=False,    # this is only added as needed
-            services=False,
-            processes=False,
-            os=False,
-            access=False
+        # address, reachable and discovered must be true for success
+        # (discovery value is only added as needed)
+        mask_bits = (
+            HostVector.OBS_ADDRESS
+            | HostVector.OBS_REACHABLE
+            | HostVector.OBS_DISCOVERED
         )
         if action.is_exploit():
             # exploit action, so get all observations for host
-            obs_kwargs["compromised"] = True
-            obs_kwargs["services"] = True
-            obs_kwargs["os"] = True
-            obs_kwargs["access"] = True
-            obs_kwargs["value"] = True
+            mask_bits |= (
+                HostVector.OBS_COMPROMISED
+                | HostVector.OBS_SERVICES
+                | HostVector.OBS_OS
+                | HostVector.OBS_ACCESS
+                | HostVector.OBS_VALUE
+            )
         elif action.is_privilege_escalation():
-            obs_kwargs["compromised"] = True
-            obs_kwargs["access"] = True
+            mask_bits |= HostVector.OBS_COMPROMISED | HostVector.OBS_ACCESS
         elif action.is_service_scan():
-            obs_kwargs["services"] = True
+            mask_bits |= HostVector.OBS_SERVICES
         elif action.is_os_scan():
-            obs_kwargs["os"] = True
+            mask_bits |= HostVector.OBS_OS
         elif action.is_process_scan():
-            obs_kwargs["processes"] = True
-            obs_kwargs["access"] = True
+            mask_bits |= HostVector.OBS_PROCESSES | HostVector.OBS_ACCESS
         elif action.is_subnet_scan():
             for host_addr in action_result.discovered:
                 discovered = action_result.discovered[host_addr]
                 if not discovered:
                     continue
                 d_idx, d_host = self.get_host_and_idx(host_addr)
-                newly_discovered = action_result.newly_discovered[host_addr]
-                d_obs = d_host.observe(
-                    discovery_value=newly_discovered, **obs_kwargs
-                )
-                obs.update_from_host(d_idx, d_obs)
+                d_mask_bits = mask_bits
+                if action_result.newly_discovered[host_addr]:
+                    d_mask_bits |= HostVector.OBS_DISCOVERY_VALUE
+                d_host.observe_masked(d_mask_bits, out=obs.tensor[d_idx])
             # this is for target host (where scan was performed on)
-            obs_kwargs["compromised"] = True
+            mask_bits |= HostVector.OBS_COMPROMISED
         else:
             raise NotImplementedError(f"Action {action} not implemented")
-        target_obs = t_host.observe(**obs_kwargs)
-        obs.update_from_host(t_idx, target_obs)
+        # observation tensor rows are zeroed so host observations are written
+        # directly into them
+        t_host.observe_masked(mask_bits, out=obs.tensor[t_idx])
         return obs
 
     def shape_flat(self):
-        return self.numpy_flat().shape
+        return (self.tensor.size, )
 
     def shape(self):
         return self.tensor.shape
@@ -217,35 +218,55 @@ class State:
 
     def get_host(self, host_addr):
         host_idx = self.host_num_map[host_addr]
-        return HostVector(self.tensor[host_idx])
+        # address is already known so pass it on to avoid decoding it from
+        # the one-hot address features
+        return HostVector(self.tensor[host_idx], host_addr)
 
     def get_host_idx(self, host_addr):
         return self.host_num_map[host_addr]
 
     def get_host_and_idx(self, host_addr):
         host_idx = self.host_num_map[host_addr]
-        return host_idx, HostVector(self.tensor[host_idx])
+        return host_idx, HostVector(self.tensor[host_idx], host_addr)
+
+    # the following read and write host features directly from the state
+    # tensor to avoid constructing a HostVector for each query
 
     def host_reachable(self, host_addr):
-        return self.get_host(host_addr).reachable
+        host_idx = self.host_num_map[host_addr]
+        return self.tensor[host_idx, HostVector._reachable_idx]
 
     def host_compromised(self, host_addr):
-        return self.get_host(host_addr).compromised
+        host_idx = self.host_num_map[host_addr]
+        return self.tensor[host_idx, HostVector._compromised_idx]
 
     def host_discovered(self, host_addr):
-        return self.get_host(host_addr).discovered
+        host_idx = self.host_num_map[host_addr]
+        return self.tensor[host_idx, HostVector._discovered_idx]
 
     def host_has_access(self, host_addr, access_level):
-        return self.get_host(host_addr).access >= access_level
+        host_idx = self.host_num_map[host_addr]
+        return self.tensor[host_idx, HostVector._access_idx] >= access_level
 
     def set_host_compromised(self, host_addr):
-        self.get_host(host_addr).compromised = True
+        host_idx = self.host_num_map[host_addr]
+        self.tensor[host_idx, HostVector._compromised_idx] = 1
 
     def set_host_reachable(self, host_addr):
-        self.get_host(host_addr).reachable = True
+        host_idx = self.host_num_map[host_addr]
+        self.tensor[host_idx, HostVector._reachable_idx] = 1
 
     def set_host_discovered(self, host_addr):
-        self.get_host(host_addr).discovered = True
+        host_idx = self.host_num_map[host_addr]
+        self.tensor[host_idx, HostVector._discovered_idx] = 1
+
+    def hosts_compromised_mask(self):
+        """Get mask of compromised hosts, in order of host number """
+        return self.tensor[:, HostVector._compromised_idx] != 0
+
+    def hosts_reachable_mask(self):
+        """Get mask of reachable hosts, in order of host number """
+        return self.tensor[:, HostVector._reachable_idx] != 0
 
     def get_host_value(self, host_address):
         return self.hosts[host_address].get_value()
@@ -257,11 +278,7 @@ class State:
         return self.get_host(host_addr).is_running_os(os)
 
     def get_total_host_value(self):
-        total_value = 0
-        for host_addr in self.host_num_map:
-            host = self.get_host(host_addr)
-            total_value += host.value
-        return total_value
+        return self.tensor[:, HostVector._value_idx].sum()
 
     def state_size(self):
         return self.tensor.size
@@ -281,8 +298,23 @@ class State:
             output += str(host) + "\n"
         return output
 
+    def hash_key(self):
+        """Get a compact digest of the state tensor.
+
+        Useful as a key for tracking visited states, since it is cheaper to
+        store and compare than the state itself.
+
+        Returns
+        -------
+        bytes
+            8 byte digest of the state tensor
+        """
+        return hashlib.blake2b(self.tensor.tobytes(), digest_size=8).digest()
+
     def __hash__(self):
-        return hash(str(self.tensor))
+        return hash(self.tensor.tobytes())
 
     def __eq__(self, other):
+        if self is other or self.tensor is other.tensor:
+            return True
         return np.array_equal(self.tensor, other.tensor)
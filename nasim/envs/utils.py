@@ -1,7 +1,5 @@
 import enum
 import numpy as np
-from queue import deque
-from itertools import permutations
 
 INTERNET = 0
 
@@ -59,47 +57,52 @@ def get_minimal_hops_to_goal(topology, sensitive_addresses):
     int
         minimum number of network hops to reach all sensitive hosts
     """
+    topology = np.asarray(topology)
     num_subnets = len(topology)
     max_value = np.iinfo(np.int16).max
-    distance = np.full((num_subnets, num_subnets),
-                       max_value,
-                       dtype=np.int16)
-
-    # set distances for each edge to 1
-    for s1 in range(num_subnets):
-        for s2 in range(num_subnets):
-            if s1 == s2:
-                distance[s1][s2] = 0
-            elif topology[s1][s2] == 1:
-                distance[s1][s2] = 1
+    # int32 so sum of two unreachable (max_value) distances cannot overflow,
+    # and taking the minimum keeps all distances <= max_value
+    distance = np.full((num_subnets, num_subnets), max_value, dtype=np.int32)
+    distance[topology == 1] = 1
+    np.fill_diagonal(distance, 0)
+
     # find all pair minimum shortest path distance
     for k in range(num_subnets):
-        for i in range(num_subnets):
-            for j in range(num_subnets):
-                if distance[i][k] == max_value \
-                   or distance[k][j] == max_value:
-                    dis = max_value
-                else:
-                    dis = distance[i][k] + distance[k][j]
-                if distance[i][j] > dis:
-                    distance[i][j] = distance[i][k] + distance[k][j]
-
-    # get list of all subnets we need to visit
-    subnets_to_visit = [INTERNET]
-    for subnet, host in sensitive_addresses:
-        if subnet not in subnets_to_visit:
-            subnets_to_visit.append(subnet)
+        # only rows that can reach k can be improved by going via k
+        rows = np.flatnonzero(distance[:, k] < max_value)
+        distance[rows] = np.minimum(
+            distance[rows], distance[rows, k:k+1] + distance[k]
+        )
 
-    # find minimum shortest path that visits internet subnet and all
-    # sensitive subnets by checking all possible permutations
-    shortest = max_value
-    for pm in permutations(subnets_to_visit):
-        pm_sum = 0
-        for i in range(len(pm) - 1):
-            pm_sum += distance[pm[i]][pm[i+1]]
-        shortest = min(shortest, pm_sum)
+    # get list of all subnets we need to visit (without duplicates)
+    subnets_to_visit = list(dict.fromkeys(
+        [INTERNET] + [subnet for subnet, host in sensitive_addresses]
+    ))
 
-    return shortest
+    # find minimum shortest path that visits internet subnet and all
+    # sensitive subnets, in any order, using Held-Karp dynamic programming
+    # over subsets of subnets to visit
+    num_visit = len(subnets_to_visit)
+    visit_distance = distance[np.ix_(subnets_to_visit, subnets_to_visit)]
+    visit_distance = visit_distance.tolist()
+    # shortest[mask][i] = shortest path visiting subnets in mask, ending at i
+    shortest = [[max_value] * num_visit for _ in range(1 << num_visit)]
+    for i in range(num_visit):
+        shortest[1 << i][i] = 0
+    for mask in range(1, 1 << num_visit):
+        for i in range(num_visit):
+            dis = shortest[mask][i]
+            if dis >= max_value:
+                continue
+            for j in range(num_visit):
+                if mask & (1 << j):
+                    continue
+                next_mask = mask | (1 << j)
+                next_dis = dis + visit_distance[i][j]
+                if next_dis < shortest[next_mask][j]:
+                    shortest[next_mask][j] = next_dis
+
+    return min(max_value, min(shortest[-1]))
 
 
 def min_subnet_depth(topology):
@@ -117,25 +120,20 @@ def min_subnet_depth(topology):
     depths : list
         depth of each subnet ordered by subnet index in topology
     """
+    topology = np.asarray(topology) == 1
     num_subnets = len(topology)
 
-    assert len(topology[0]) == num_subnets
-
-    depths = []
-    Q = deque()
-    for subnet in range(num_subnets):
-        if topology[subnet][INTERNET] == 1:
-            depths.append(0)
-            Q.appendleft(subnet)
-        else:
-            depths.append(float('inf'))
-
-    while len(Q) > 0:
-        parent = Q.pop()
-        for child in range(num_subnets):
-            if topology[parent][child] == 1:
-                # child is connected to parent
-                if depths[child] > depths[parent] + 1:
-                    depths[child] = depths[parent] + 1
-                    Q.appendleft(child)
+    assert topology.shape[1] == num_subnets
+
+    # breadth first search from exposed subnets, one depth level at a time
+    depths = [float('inf')] * num_subnets
+    frontier = topology[:, INTERNET].copy()
+    visited = frontier.copy()
+    depth = 0
+    while frontier.any():
+        for subnet in np.flatnonzero(frontier).tolist():
+            depths[subnet] = depth
+        frontier = topology[frontier].any(axis=0) & ~visited
+        visited |= frontier
+        depth += 1
     return depths
@@ -1,19 +1,51 @@
+import copy as _copy
+import functools
+import sys
+
+import numpy as np
+
 from nasim.scenarios.utils import INTERNET
 from nasim.scenarios.scenario import Scenario
-from nasim.scenarios.loader import ScenarioLoader
-from nasim.scenarios.generator import ScenarioGenerator
 import nasim.scenarios.benchmark as benchmark
 
 
-def make_benchmark_scenario(scenario_name, seed=None):
+# cache of generated scenarios, keyed on generator params and seed
+_GEN_CACHE = {}
+_GEN_CACHE_SIZE = 64
+
+
+def __getattr__(name):
+    # ScenarioLoader (which needs PyYAML) and ScenarioGenerator are
+    # imported lazily so importing nasim.scenarios only pays for what
+    # is used
+    if name == "ScenarioLoader":
+        from nasim.scenarios.loader import ScenarioLoader
+        globals()[name] = ScenarioLoader
+        return ScenarioLoader
+    if name == "ScenarioGenerator":
+        from nasim.scenarios.generator import ScenarioGenerator
+        globals()[name] = ScenarioGenerator
+        return ScenarioGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def make_benchmark_scenario(scenario_name, seed=None, copy=True):
     """Generate or Load a benchmark Scenario.
 
+    Scenarios are cached so repeated calls do not re-parse or
+    re-generate the same scenario. Generated scenarios with
+    ``seed=None`` are never cached (see :func:`generate_scenario`).
+
     Parameters
     ----------
     scenario_name : str
         the name of the benchmark environment
     seed : int, optional
         random seed to use to generate environment (default=None)
+    copy : bool, optional
+        if True returns a deep copy of the cached scenario, otherwise
+        may return the shared cached instance which must not be modified
+        (default=True)
 
     Returns
     -------
@@ -25,21 +57,40 @@ def make_benchmark_scenario(scenario_name, seed=None):
     NotImplementederror
         if scenario_name does no match any implemented benchmark scenarios.
     """
-    if scenario_name in benchmark.AVAIL_GEN_BENCHMARKS:
-        params = benchmark.AVAIL_GEN_BENCHMARKS[scenario_name]
-        params['seed'] = seed
-        return generate_scenario(**params)
-    elif scenario_name in benchmark.AVAIL_STATIC_BENCHMARKS:
-        scenario_def = benchmark.AVAIL_STATIC_BENCHMARKS[scenario_name]
-        return load_scenario(scenario_def["file"], name=scenario_name)
-    else:
+    if isinstance(scenario_name, str):
+        scenario_name = sys.intern(scenario_name)
+    handler = _HANDLERS.get(scenario_name)
+    if handler is None:
         raise NotImplementedError(
-            f"Benchmark scenario '{scenario_name}' not available."
-            f"Available scenarios are: {benchmark.AVAIL_BENCHMARKS}"
+            f"Benchmark scenario '{scenario_name}' not available. "
+            f"Available scenarios are: {_AVAIL_BENCHMARKS_STR}"
         )
+    return handler(seed, copy)
+
+
+def _generated_benchmark(params, seed, copy):
+    if seed is None:
+        # unseeded scenarios are not cached, so are always new
+        return generate_scenario(seed=seed, **params)
+    scenario = _cached_generate_scenario(seed=seed, **params)
+    if copy:
+        return _copy.deepcopy(scenario)
+    return scenario
+
+
+def _static_benchmark(scenario_name, path, seed, copy):
+    scenario = _load_static_benchmark(scenario_name, path)
+    if copy:
+        return _copy.deepcopy(scenario)
+    return scenario
+
+
+@functools.lru_cache(maxsize=None)
+def _load_static_benchmark(scenario_name, path):
+    return load_scenario(path, name=scenario_name)
 
 
-def generate_scenario(num_hosts, num_services, **params):
+def generate_scenario(num_hosts, num_services, seed=None, **params):
     """Generate Scenario from network parameters.
 
     Parameters
@@ -48,6 +99,8 @@ def generate_scenario(num_hosts, num_services, **params):
         number of hosts to include in network (minimum is 3)
     num_services : int
         number of services to use in environment (minimum is 1)
+    seed : int, optional
+        random seed to use to generate scenario (default=None)
     params : dict, optional
         generator params (see :class:`ScenarioGenertor` for full list)
 
@@ -55,9 +108,49 @@ def generate_scenario(num_hosts, num_services, **params):
     -------
     Scenario
         a new scenario object
+
+    Notes
+    -----
+    When a seed is given the generated scenario is cached on the full set
+    of parameters, and a copy of the cached scenario is returned on
+    repeat calls.
     """
-    generator = ScenarioGenerator()
-    return generator.generate(num_hosts, num_services, **params)
+    if seed is None:
+        from nasim.scenarios.generator import ScenarioGenerator
+        generator = ScenarioGenerator()
+        return generator.generate(num_hosts, num_services, **params)
+    return _copy.deepcopy(
+        _cached_generate_scenario(num_hosts, num_services, seed, **params)
+    )
+
+
+def _cached_generate_scenario(num_hosts, num_services, seed, **params):
+    """Get the shared cached scenario for the given seed and parameters,
+    generating it if not cached. The result must not be modified.
+    """
+    from nasim.scenarios.generator import ScenarioGenerator
+    try:
+        key = (num_hosts, num_services, seed, frozenset(params.items()))
+        hash(key)
+    except TypeError:
+        key = (
+            num_hosts, num_services, seed, repr(sorted(params.items()))
+        )
+
+    scenario = _GEN_CACHE.get(key)
+    if scenario is None:
+        generator = ScenarioGenerator()
+        scenario = generator.generate(
+            num_hosts, num_services, seed=seed, **params
+        )
+        if len(_GEN_CACHE) >= _GEN_CACHE_SIZE:
+            # evict oldest entry
+            del _GEN_CACHE[next(iter(_GEN_CACHE))]
+        _GEN_CACHE[key] = scenario
+    else:
+        # seed global RNG as generating the scenario would have
+        np.random.seed(seed)
+    return scenario
 
 
 def load_scenario(path, name=None):
@@ -76,13 +169,33 @@ def load_scenario(path, name=None):
     Scenario
         a new scenario object
     """
+    from nasim.scenarios.loader import ScenarioLoader
     loader = ScenarioLoader()
     return loader.load(path, name=name)
 
 
 def get_scenario_max(scenario_name):
-    if scenario_name in benchmark.AVAIL_GEN_BENCHMARKS:
-        return benchmark.AVAIL_GEN_BENCHMARKS[scenario_name]["max_score"]
-    elif scenario_name in benchmark.AVAIL_STATIC_BENCHMARKS:
-        return benchmark.AVAIL_STATIC_BENCHMARKS[scenario_name]["max_score"]
-    return None
+    return _MAX_SCORES.get(scenario_name)
+
+
+# benchmark name -> handler(seed, copy) that makes the scenario
+_HANDLERS = {}
+for _name, _params in benchmark.AVAIL_GEN_BENCHMARKS.items():
+    _HANDLERS[_name] = functools.partial(_generated_benchmark, _params)
+for _name, _scenario_def in benchmark.AVAIL_STATIC_BENCHMARKS.items():
+    _HANDLERS[_name] = functools.partial(
+        _static_benchmark, _name, _scenario_def["file"]
+    )
+del _name, _params, _scenario_def
+
+_AVAIL_BENCHMARKS_STR = ", ".join(sorted(benchmark.AVAIL_BENCHMARKS))
+
+# max score of each benchmark scenario that defines one
+_MAX_SCORES = {
+    name: scenario_def["max_score"]
+    for name, scenario_def in (
+        *benchmark.AVAIL_GEN_BENCHMARKS.items(),
+        *benchmark.AVAIL_STATIC_BENCHMARKS.items()
+    )
+    if "max_score" in scenario_def
+}
@@ -1,65 +1,37 @@
+import sys
 import os.path as osp
+from types import MappingProxyType
 
 from nasim.scenarios.benchmark.generated import AVAIL_GEN_BENCHMARKS
 
 BENCHMARK_DIR = osp.dirname(osp.abspath(__file__))
 
-AVAIL_STATIC_BENCHMARKS = {
-    "tiny": {
-        "file": osp.join(BENCHMARK_DIR, "tiny.yaml"),
-        "name": "tiny",
-        "step_limit": 1000,
-        "max_score": 195
-    },
-    "tiny-hard": {
-        "file": osp.join(BENCHMARK_DIR, "tiny-hard.yaml"),
-        "name": "tiny-hard",
-        "step_limit": 1000,
-        "max_score": 192
-    },
-    "tiny-small": {
-        "file": osp.join(BENCHMARK_DIR, "tiny-small.yaml"),
-        "name": "tiny-small",
-        "step_limit": 1000,
-        "max_score": 189
-    },
-    "small": {
-        "file": osp.join(BENCHMARK_DIR, "small.yaml"),
-        "name": "small",
-        "step_limit": 1000,
-        "max_score": 186
-    },
-    "small-honeypot": {
-        "file": osp.join(BENCHMARK_DIR, "small-honeypot.yaml"),
-        "name": "small-honeypot",
-        "step_limit": 1000,
-        "max_score": 186
-    },
-    "small-linear": {
-        "file": osp.join(BENCHMARK_DIR, "small-linear.yaml"),
-        "name": "small-linear",
-        "step_limit": 1000,
-        "max_score": 187
-    },
-    "medium": {
-        "file": osp.join(BENCHMARK_DIR, "medium.yaml"),
-        "name": "medium",
-        "step_limit": 2000,
-        "max_score": 190
-    },
-    "medium-single-site": {
-        "file": osp.join(BENCHMARK_DIR, "medium-single-site.yaml"),
-        "name": "medium-single-site",
-        "step_limit": 2000,
-        "max_score": 195
-    },
-    "medium-multi-site": {
-        "file": osp.join(BENCHMARK_DIR, "medium-multi-site.yaml"),
-        "name": "medium-multi-site",
-        "step_limit": 2000,
-        "max_score": 190
-    },
-}
+# (name, step_limit, max_score) for each static benchmark scenario
+_STATIC_BENCHMARK_TABLE = (
+    ("tiny", 1000, 195),
+    ("tiny-hard", 1000, 192),
+    ("tiny-small", 1000, 189),
+    ("small", 1000, 186),
+    ("small-honeypot", 1000, 186),
+    ("small-linear", 1000, 187),
+    ("medium", 2000, 190),
+    ("medium-single-site", 2000, 195),
+    ("medium-multi-site", 2000, 190),
+)
 
-AVAIL_BENCHMARKS = list(AVAIL_STATIC_BENCHMARKS.keys()) \
-                    + list(AVAIL_GEN_BENCHMARKS.keys())
+_static_benchmarks = {}
+for _name, _step_limit, _max_score in _STATIC_BENCHMARK_TABLE:
+    _name = sys.intern(_name)
+    _static_benchmarks[_name] = MappingProxyType({
+        "file": f"{BENCHMARK_DIR}{osp.sep}{_name}.yaml",
+        "name": _name,
+        "step_limit": _step_limit,
+        "max_score": _max_score
+    })
+del _name, _step_limit, _max_score
+
+# read-only so benchmark definitions can be safely shared
+AVAIL_STATIC_BENCHMARKS = MappingProxyType(_static_benchmarks)
+
+AVAIL_BENCHMARKS = frozenset(AVAIL_STATIC_BENCHMARKS) \
+                    | frozenset(AVAIL_GEN_BENCHMARKS)
@@ -0,0 +1,31 @@
+"""Default parameters shared by all generated benchmark scenarios.
+
+The mapping is read-only, scenario definitions should be built by
+copying it (e.g. ``{**DEFAULTS, "num_hosts": 3}``).
+"""
+from types import MappingProxyType
+
+# generated environment constants
+DEFAULTS = MappingProxyType(dict(
+    num_exploits=None,
+    num_privescs=None,
+    r_sensitive=100,
+    r_user=100,
+    exploit_cost=1,
+    exploit_probs='mixed',
+    privesc_cost=1,
+    privesc_probs=1.0,
+    service_scan_cost=1,
+    os_scan_cost=1,
+    subnet_scan_cost=1,
+    process_scan_cost=1,
+    uniform=False,
+    alpha_H=2.0,
+    alpha_V=2.0,
+    lambda_V=1.0,
+    random_goal=False,
+    base_host_value=1,
+    host_discovery_value=1,
+    step_limit=1000,
+    address_space_bounds=None
+))
@@ -5,6 +5,7 @@ configurations based on number of hosts and services in network using standard
 formula.
 """
 import math
+import itertools
 import numpy as np
 
 import nasim.scenarios.utils as u
@@ -158,7 +159,9 @@ class ScenarioGenerator:
         host_discovery_value : int, optional
             value of discovering a host for the first time (default=1)
         seed : int, optional
-            random number generator seed (default=None)
+            random number generator seed, if not None also used to seed
+            numpy's global RNG, which is used by the environment for
+            action outcomes (default=None)
         name : str, optional
             name of the scenario, if None one will be generated (default=None)
         step_limit : int, optional
@@ -185,8 +188,14 @@ class ScenarioGenerator:
         assert 0 < restrictiveness
 
         if seed is not None:
+            # generation uses its own RNG, but seeding the global RNG keeps
+            # env action outcomes reproducible from the scenario seed
             np.random.seed(seed)
 
+        # generator local (not global numpy) RNG, using the SFC64 bit
+        # generator which is faster per draw than default PCG64
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+
         if num_exploits is None:
             num_exploits = num_services
 
@@ -269,34 +278,22 @@ class ScenarioGenerator:
     def _generate_topology(self):
         # including internet subnet
         num_subnets = len(self.subnets)
-        topology = np.zeros((num_subnets, num_subnets))
+        topology = np.zeros((num_subnets, num_subnets), dtype=np.int8)
         # DMZ subnet is connected to sensitive and first user subnet and also
         # to internet
-        for row in range(USER + 1):
-            for col in range(USER + 1):
-                if row == u.INTERNET and col > DMZ:
-                    continue
-                if row > DMZ and col == u.INTERNET:
-                    continue
-                topology[row][col] = 1
-        if num_subnets == USER + 1:
-            self.topology = topology
-            return
-        # all other subnets are part of user binary tree
-        for row in range(USER, num_subnets):
-            # subnet connected to itself
-            topology[row][row] = 1
-            # position in tree
-            pos = row - USER
-            if pos > 0:
-                parent = ((pos - 1) // 2) + 3
-                topology[row][parent] = 1
-            child_left = ((2 * pos) + 1) + 3
-            child_right = ((2 * pos) + 2) + 3
-            if child_left < num_subnets:
-                topology[row][child_left] = 1
-            if child_right < num_subnets:
-                topology[row][child_right] = 1
+        topology[:USER+1, :USER+1] = 1
+        topology[u.INTERNET, DMZ+1:USER+1] = 0
+        topology[DMZ+1:USER+1, u.INTERNET] = 0
+        # all other subnets are part of user binary tree, including first
+        # user subnet, pos is position in tree
+        pos = np.arange(num_subnets - USER)
+        rows = pos + USER
+        # subnet connected to itself
+        topology[rows, rows] = 1
+        # and to parent, and so each parent to its children
+        parents = ((pos[1:] - 1) // 2) + USER
+        topology[rows[1:], parents] = 1
+        topology[parents, rows[1:]] = 1
         self.topology = topology
 
     def _generate_address_space_bounds(self, address_space_bounds):
@@ -324,12 +321,19 @@ class ScenarioGenerator:
 
     def _generate_os(self, num_os):
         self.os = [f"os_{i}" for i in range(num_os)]
+        # None (any OS) maps to extra final index
+        self._os_idx = {os: i for i, os in enumerate(self.os)}
+        self._os_idx[None] = num_os
 
     def _generate_services(self, num_services):
         self.services = [f"srv_{s}" for s in range(num_services)]
+        self._srv_idx = {srv: i for i, srv in enumerate(self.services)}
 
     def _generate_processes(self, num_processes):
         self.processes = [f"proc_{s}" for s in range(num_processes)]
+        self._proc_idx = {
+            proc: i for i, proc in enumerate(self.processes)
+        }
 
     def _generate_exploits(self, num_exploits, exploit_cost, exploit_probs):
         exploits = {}
@@ -339,9 +343,9 @@ class ScenarioGenerator:
         # we create one exploit per service
         exploits_added = 0
         while exploits_added < num_exploits:
-            srv = np.random.choice(self.services)
-            os = np.random.choice(possible_os)
-            al = np.random.randint(u.USER_ACCESS, u.ROOT_ACCESS+1)
+            srv = self.services[self.rng.integers(len(self.services))]
+            os = possible_os[self.rng.integers(len(possible_os))]
+            al = int(self.rng.integers(u.USER_ACCESS, u.ROOT_ACCESS+1))
             e_name = f"e_{srv}"
             if os is not None:
                 e_name += f"_{os}"
@@ -356,6 +360,25 @@ class ScenarioGenerator:
                 exploits_added += 1
         self.exploits = exploits
 
+        # exploit attributes as arrays, in same order as self.exploits
+        e_defs = tuple(exploits.values())
+        self._e_defs = e_defs
+        self._e_srv = [e[u.EXPLOIT_SERVICE] for e in e_defs]
+        self._e_srv_idx = np.array(
+            [self._srv_idx[srv] for srv in self._e_srv], dtype=int
+        )
+        self._e_os_idx = np.array(
+            [self._os_idx[e[u.EXPLOIT_OS]] for e in e_defs], dtype=int
+        )
+        self._e_access = np.array(
+            [e[u.EXPLOIT_ACCESS] for e in e_defs], dtype=int
+        )
+        # bitset of exploits giving at least each access level
+        self._e_access_bits = {
+            level: np.packbits(self._e_access >= level)
+            for level in (u.USER_ACCESS, u.ROOT_ACCESS)
+        }
+
     def _generate_privescs(self, num_privesc, privesc_cost, privesc_probs):
         privescs = {}
         privesc_probs = self._get_action_probs(num_privesc, privesc_probs)
@@ -369,13 +392,17 @@ class ScenarioGenerator:
         if num_privesc < len(self.os):
             os_choices = [None]
             os_choices.extend(
-                list(np.random.choice(possible_os, num_privesc-1))
+                possible_os[i] for i in self.rng.integers(
+                    len(possible_os), size=num_privesc-1
+                )
             )
         else:
             while True:
-                os_choices = list(
-                    np.random.choice(possible_os, num_privesc)
-                )
+                os_choices = [
+                    possible_os[i] for i in self.rng.integers(
+                        len(possible_os), size=num_privesc
+                    )
+                ]
                 if None in os_choices \
                    or all([os in os_choices for os in self.os]):
                     break
@@ -383,7 +410,7 @@ class ScenarioGenerator:
         # we create one exploit per service
         privescs_added = 0
         while privescs_added < num_privesc:
-            proc = np.random.choice(self.processes)
+            proc = self.processes[self.rng.integers(len(self.processes))]
             os = os_choices[privescs_added]
             pe_name = f"pe_{proc}"
             if os is not None:
@@ -399,9 +426,20 @@ class ScenarioGenerator:
                 privescs_added += 1
         self.privescs = privescs
 
+        # privesc attributes as arrays, in same order as self.privescs
+        pe_defs = tuple(privescs.values())
+        self._pe_defs = pe_defs
+        self._pe_proc_idx = np.array(
+            [self._proc_idx[pe[u.PRIVESC_PROCESS]] for pe in pe_defs],
+            dtype=int
+        )
+        self._pe_os_idx = np.array(
+            [self._os_idx[pe[u.PRIVESC_OS]] for pe in pe_defs], dtype=int
+        )
+
     def _get_action_probs(self, num_actions, action_probs):
         if action_probs is None:
-            action_probs = np.random.random_sample(num_actions)
+            action_probs = self.rng.random(num_actions)
         elif action_probs == 'mixed':
             # success probability of low, med, high attack complexity
             if num_actions == 1:
@@ -412,7 +450,7 @@ class ScenarioGenerator:
             else:
                 levels = [0.3, 0.6, 0.9]
                 probs = [0.2, 0.4, 0.4]
-            action_probs = np.random.choice(levels, num_actions, p=probs)
+            action_probs = self.rng.choice(levels, num_actions, p=probs)
         elif type(action_probs) is list:
             assert len(action_probs) == num_actions, \
                 ("Length of action probability list must equal number of"
@@ -438,8 +476,8 @@ class ScenarioGenerator:
         # second sensitive host in USER network
         if random_goal and len(self.subnets) > SENSITIVE:
             # randomly choose user host to be goal
-            subnet_id = np.random.randint(USER, len(self.subnets))
-            host_id = np.random.randint(0, self.subnets[subnet_id])
+            subnet_id = int(self.rng.integers(USER, len(self.subnets)))
+            host_id = int(self.rng.integers(0, self.subnets[subnet_id]))
             sensitive_hosts[(subnet_id, host_id)] = r_user
         else:
             # second last host in USER network is goal
@@ -448,123 +486,136 @@ class ScenarioGenerator:
 
     def _generate_uniform_hosts(self):
         hosts = dict()
-        srv_config_set, proc_config_set = self._possible_host_configs()
-        num_srv_configs = len(srv_config_set)
-        num_proc_configs = len(proc_config_set)
+        # draw configs for all hosts up front (excluding internet subnet)
+        # sampling uniformly from all possible configs without building
+        # the set of all 2**n possible configs
+        num_hosts = sum(self.subnets[1:])
+        srv_cfgs = self._sample_configs(len(self.services), num_hosts)
+        proc_cfgs = self._sample_configs(len(self.processes), num_hosts)
+        os_choices = self.rng.integers(0, len(self.os), size=num_hosts)
+        os_maps = [self._convert_to_os_map(os) for os in self.os]
+        srv_maps = self._convert_configs(
+            srv_cfgs, self._convert_to_service_map
+        )
+        proc_maps = self._convert_configs(
+            proc_cfgs, self._convert_to_process_map
+        )
 
+        host_num = 0
         for subnet, size in enumerate(self.subnets):
             if subnet == u.INTERNET:
                 continue
             for h in range(size):
-                srv_cfg = srv_config_set[np.random.choice(num_srv_configs)]
-                srv_cfg = self._convert_to_service_map(srv_cfg)
-
-                proc_cfg = proc_config_set[np.random.choice(num_proc_configs)]
-                proc_cfg = self._convert_to_process_map(proc_cfg)
-
-                os = np.random.choice(self.os)
-                os_cfg = self._convert_to_os_map(os)
-
                 address = (subnet, h)
                 value = self._get_host_value(address)
                 host = Host(
                     address=address,
-                    os=os_cfg.copy(),
-                    services=srv_cfg.copy(),
-                    processes=proc_cfg.copy(),
+                    # copy since OS may be changed to make host vulnerable
+                    os=os_maps[os_choices[host_num]].copy(),
+                    services=srv_maps[host_num],
+                    processes=proc_maps[host_num],
                     firewall={},
                     value=value,
                     discovery_value=self.host_discovery_value
                 )
                 hosts[address] = host
+                host_num += 1
         self.hosts = hosts
 
-    def _possible_host_configs(self):
-        """Generate set of all possible host service and process configurations
-        based on number of services and processes in environment.
-
-        Note: Each host is vulnerable to at least one exploit and one privesc,
-        so there is no configuration where all services and processes are
-        absent.
+    @staticmethod
+    def _unpack_configs(vals, n):
+        """Convert ints to configs, element k of row i is bit k of vals[i] """
+        vals = np.asarray(vals, dtype="<u8")
+        # only unpack the low bytes holding the n bits, unpacked 0/1 bytes
+        # can be viewed as bools without a copy
+        low_bytes = vals.view(np.uint8).reshape(-1, 8)[:, :(n + 7) // 8]
+        bits = np.unpackbits(low_bytes, axis=1, count=n, bitorder="little")
+        return bits.view(bool)
 
-        Returns
-        -------
-        list[list]
-            all possible service configurations, where each configuration is
-            a list of bools corresponding to the presence or absence of a
-            service
-        list[list]
-            all possible process configurations, same as above except for
-            processes
-        """
-        # remove last permutation which is all False
-        srv_configs = self._permutations(len(self.services))[:-1]
-        proc_configs = self._permutations(len(self.processes))[:-1]
-        return srv_configs, proc_configs
-
-    def _permutations(self, n):
-        """Generate list of all possible permutations of n bools
-
-        N.B First permutation in list is always the all True permutation
-        and final permutation in list is always the all False permutationself.
-
-        perms[1] = [True, ..., True]
-        perms[-1] = [False, ..., False]
+    def _sample_configs(self, n, size):
+        """Sample configs uniformly from all configurations of n bools,
+        excluding the all False one.
 
         Parameters
         ----------
         n : int
-            bool list length
+            number of bools in each configuration
+        size : int
+            number of configurations to sample
 
         Returns
         -------
-        perms : list[list]
-            all possible permutations of n bools
+        list[list[bool]]
+            the sampled configurations
         """
-        # base cases
-        if n <= 0:
-            return []
-        if n == 1:
-            return [[True], [False]]
-
-        perms = []
-        for p in self._permutations(n - 1):
-            perms.append([True] + p)
-            perms.append([False] + p)
-        return perms
+        if n <= 64:
+            # each config is the bits of an int in [1, 2**n)
+            vals = self.rng.integers(
+                1, 1 << n, size=size, dtype=np.uint64, endpoint=False
+            )
+            return self._unpack_configs(vals, n).tolist()
+        # too many bools to fit in an int, so draw each bool and redraw
+        # the (very unlikely) all False configs
+        cfgs = self.rng.random((size, n)) < 0.5
+        empty = ~cfgs.any(axis=1)
+        while empty.any():
+            cfgs[empty] = self.rng.random((empty.sum(), n)) < 0.5
+            empty = ~cfgs.any(axis=1)
+        return cfgs.tolist()
 
     def _generate_correlated_hosts(self, alpha_H, alpha_V, lambda_V):
         hosts = dict()
         prev_configs = []
         prev_os = []
-        prev_srvs = []
-        prev_procs = []
+        # draw each host's new vs previous config test and choice up front
+        # (excluding internet subnet), the first host always gets a new
+        # config, as does the second since alpha_H / (alpha_H + 0) == 1
+        num_hosts = sum(self.subnets[1:])
+        new_probs, choice_probs = self.rng.random((2, num_hosts))
+        steps = np.arange(num_hosts)
+        new_configs = new_probs < (
+            alpha_H / (alpha_H + np.maximum(steps - 1, 0))
+        )
+        # number of services and processes to sample for each new config
+        num_samples = np.maximum(
+            self.rng.poisson(lambda_V, size=(num_hosts, 2)), 1
+        )
+        num_samples[~new_configs] = 0
+        # sampled services and processes are stored in arrays preallocated
+        # for all samples, with each new config's samples ending at the
+        # cumulative number of samples up to and including that config
+        sample_ends = np.cumsum(num_samples, axis=0)
+        prev_srvs = np.zeros(sample_ends[-1, 0], dtype=int)
+        prev_procs = np.zeros(sample_ends[-1, 1], dtype=int)
+        new_configs = new_configs.tolist()
+        choice_probs = choice_probs.tolist()
+        num_samples = num_samples.tolist()
+        sample_ends = sample_ends.tolist()
         host_num = 0
         for subnet, size in enumerate(self.subnets):
             if subnet == u.INTERNET:
                 continue
             for m in range(size):
+                srv_end, proc_end = sample_ends[host_num]
                 os, services, processes = self._get_host_config(
-                    host_num,
-                    alpha_H,
+                    new_configs[host_num],
+                    choice_probs[host_num],
                     prev_configs,
                     alpha_V,
-                    lambda_V,
                     prev_os,
-                    prev_srvs,
-                    prev_procs
+                    prev_srvs[:srv_end],
+                    prev_procs[:proc_end],
+                    num_samples[host_num]
                 )
-                os_cfg = self._convert_to_os_map(os)
-                service_cfg = self._convert_to_service_map(services)
-                process_cfg = self._convert_to_process_map(processes)
                 host_num += 1
                 address = (subnet, m)
                 value = self._get_host_value(address)
+                # maps are newly built for each host, so no need to copy
                 host = Host(
                     address=address,
-                    os=os_cfg.copy(),
-                    services=service_cfg.copy(),
-                    processes=process_cfg.copy(),
+                    os=self._convert_to_os_map(os),
+                    services=self._convert_to_service_map(services),
+                    processes=self._convert_to_process_map(processes),
                     firewall={},
                     value=value,
                     discovery_value=self.host_discovery_value
@@ -573,36 +624,35 @@ class ScenarioGenerator:
         self.hosts = hosts
 
     def _get_host_config(self,
-                         host_num,
-                         alpha_H,
+                         new_config,
+                         choice_prob,
                          prev_configs,
                          alpha_V,
-                         lambda_V,
                          prev_os,
                          prev_srvs,
-                         prev_procs):
+                         prev_procs,
+                         num_samples):
         """Select a host configuration from all possible configurations based
         using a Nested Dirichlet Process
         """
-        if host_num == 0 \
-           or np.random.rand() < (alpha_H / (alpha_H + host_num - 1)):
+        if new_config:
             # if first host or with prob proportional to alpha_H
             # choose new config
-            new_config = self._sample_config(
-                alpha_V, prev_srvs, lambda_V, prev_os, prev_procs
+            config = self._sample_config(
+                alpha_V, prev_srvs, prev_os, prev_procs, num_samples
             )
         else:
             # sample uniformly from previous sampled configs
-            new_config = prev_configs[np.random.choice(len(prev_configs))]
-        prev_configs.append(new_config)
-        return new_config
+            config = prev_configs[int(choice_prob * len(prev_configs))]
+        prev_configs.append(config)
+        return config
 
     def _sample_config(self,
                        alpha_V,
                        prev_srvs,
-                       lambda_V,
                        prev_os,
-                       prev_procs):
+                       prev_procs,
+                       num_samples):
         """Sample a host configuration from all possible configurations based
         using a Dirichlet Process
         """
@@ -610,52 +660,88 @@ class ScenarioGenerator:
             alpha_V, self.os, prev_os
         )
 
+        num_srv_samples, num_proc_samples = num_samples
         new_services_cfg = self._dirichlet_process(
-            alpha_V, lambda_V, len(self.services), prev_srvs
+            alpha_V, num_srv_samples, len(self.services), prev_srvs
         )
 
         new_process_cfg = self._dirichlet_process(
-            alpha_V, lambda_V, len(self.processes), prev_procs
+            alpha_V, num_proc_samples, len(self.processes), prev_procs
         )
 
         return os, new_services_cfg, new_process_cfg
 
     def _dirichlet_process(self,
                            alpha_V,
-                           lambda_V,
+                           n,
                            num_options,
                            prev_vals):
-        """Sample from all possible configurations using Dirichlet Process """
-        # no options present by default
-        new_cfg = [False for i in range(num_options)]
+        """Sample from all possible configurations using Dirichlet Process
 
-        # randomly get number of times to sample using poission dist with
-        # minimum 1 option choice
-        n = max(np.random.poisson(lambda_V), 1)
+        Parameters
+        ----------
+        alpha_V : float
+            concentration parameter of Dirichlet Process
+        n : int
+            number of times to sample, drawn by caller from poisson dist with
+            minimum 1 option choice
+        num_options : int
+            number of options to sample from
+        prev_vals : np.ndarray
+            previously sampled options, with the last n entries filled in
+            with the options sampled by this call
 
+        Returns
+        -------
+        list[bool]
+            whether each option was sampled
+        """
+        num_prev = len(prev_vals) - n
+        samples = prev_vals[num_prev:]
+        # draw the new vs previous choice tests and choices up front
+        steps = np.arange(n)
+        new_probs, choice_probs = self.rng.random((2, n))
         # draw n samples from Dirichlet Process
-        # (alpha_V, uniform dist of services)
-        for i in range(n):
-            if i == 0 or np.random.rand() < (alpha_V / (alpha_V + i - 1)):
-                # draw randomly from uniform dist over services
-                x = np.random.randint(0, num_options)
-            else:
-                # draw uniformly at random from previous choices
-                x = np.random.choice(prev_vals)
-            new_cfg[x] = True
-            prev_vals.append(x)
-        return new_cfg
+        # (alpha_V, uniform dist of services), the first (i == 0) is always
+        # a new choice, as is the second since alpha_V / (alpha_V + 0) == 1
+        new_thresh = alpha_V / (alpha_V + np.maximum(steps - 1, 0))
+        is_new = new_probs < new_thresh
+        # new samples draw randomly from uniform dist over services, others
+        # draw an index uniformly at random over previous choices, including
+        # earlier samples in this draw
+        choices = np.where(
+            is_new,
+            choice_probs * num_options,
+            choice_probs * (num_prev + steps)
+        ).astype(int)
+        samples[is_new] = choices[is_new]
+        reuse_prev = ~is_new & (choices < num_prev)
+        samples[reuse_prev] = prev_vals[choices[reuse_prev]]
+        # resolve choices of earlier samples in this draw in order, so the
+        # sample they point to is already resolved
+        reuse_new = ~(is_new | reuse_prev)
+        for i, j in zip(np.flatnonzero(reuse_new), choices[reuse_new]):
+            samples[i] = prev_vals[j]
+
+        # no options present by default
+        new_cfg = np.zeros(num_options, dtype=bool)
+        new_cfg[samples] = True
+        return new_cfg.tolist()
 
     def _dirichlet_sample(self, alpha_V, choices, prev_vals):
         """Sample single choice using dirichlet process """
         # sample an os from Dirichlet Process (alpha_V, uniform dist of OSs)
-        if len(prev_vals) == 0 \
-           or np.random.rand() < (alpha_V / (alpha_V - 1)):
+        # using number of previous samples (not the loop index of the
+        # service/process samples) for the new choice probability
+        num_prev = len(prev_vals)
+        # draw new vs previous choice test and the choice itself together
+        new_prob, choice_prob = self.rng.random(2)
+        if num_prev == 0 or new_prob < (alpha_V / (alpha_V + num_prev - 1)):
             # draw randomly from uniform dist over services
-            choice = np.random.choice(choices)
+            choice = choices[int(choice_prob * len(choices))]
         else:
             # draw uniformly at random from previous choices
-            choice = np.random.choice(prev_vals)
+            choice = prev_vals[int(choice_prob * num_prev)]
         prev_vals.append(choice)
         return choice
 
@@ -664,17 +750,29 @@ class ScenarioGenerator:
 
     def _convert_to_service_map(self, config):
         """Converts list of bools to a map from service name -> bool """
-        service_map = {}
-        for srv, val in zip(self.services, config):
-            service_map[srv] = val
-        return service_map
+        return dict(zip(self.services, config))
 
     def _convert_to_process_map(self, config):
         """Converts list of bools to a map from process name -> bool """
-        process_map = {}
-        for proc, val in zip(self.processes, config):
-            process_map[proc] = val
-        return process_map
+        return dict(zip(self.processes, config))
+
+    def _convert_configs(self, configs, convert):
+        """Converts list of configs to list of maps using convert function,
+        only converting each distinct config once.
+
+        Hosts with the same config get their own copy of the map, since
+        host services and processes may be changed to make host vulnerable.
+        """
+        converted = {}
+        maps = []
+        for cfg in configs:
+            key = tuple(cfg)
+            if key in converted:
+                maps.append(converted[key].copy())
+            else:
+                converted[key] = convert(cfg)
+                maps.append(converted[key])
+        return maps
 
     def _convert_to_os_map(self, os):
         """Converts an OS string to a map from os name -> bool
@@ -683,59 +781,123 @@ class ScenarioGenerator:
         vectorizing and checking if an exploit will work (since exploits can
         have os=None)
         """
-        os_map = {}
-        for os_name in self.os:
-            os_map[os_name] = os_name == os
-        return os_map
+        return {os_name: os_name == os for os_name in self.os}
 
     def _ensure_host_vulnerability(self):
         """Ensures each subnet has at least one vulnerable host and all sensitive hosts
         are vulnerable
         """
+        # hosts are only modified after their own vulnerability is checked,
+        # so can check vulnerability of all hosts up front
+        # matrices are kept up to date as hosts are modified so they can
+        # be reused when generating firewall
+        hosts = list(self.hosts.values())
+        self._e_vuln, self._pe_vuln = self._vulnerability_matrices(hosts)
+        user_vuln, root_vuln = self._hosts_vulnerable(
+            self._e_vuln, self._pe_vuln, (u.USER_ACCESS, u.ROOT_ACCESS)
+        )
+
         vulnerable_subnets = set()
-        for host_addr, host in self.hosts.items():
+        for host_num, host in enumerate(hosts):
+            host_addr = host.address
             if not self._is_sensitive_host(host_addr) \
                and host_addr[0] in vulnerable_subnets:
                 continue
 
             if self._is_sensitive_host(host_addr):
-                if not self._host_is_vulnerable(host, u.ROOT_ACCESS):
+                if not root_vuln[host_num]:
                     self._update_host_to_vulnerable(host, u.ROOT_ACCESS)
+                    self._update_vulnerability_matrices(host_num, host)
                 vulnerable_subnets.add(host_addr[0])
-            elif self._host_is_vulnerable(host):
+            elif user_vuln[host_num]:
                 vulnerable_subnets.add(host_addr[0])
 
+        # index of first host in each subnet (internet subnet has no hosts)
+        subnet_offsets = np.cumsum([0, 0] + self.subnets[1:-1])
         for subnet, size in enumerate(self.subnets):
             if subnet in vulnerable_subnets or subnet == u.INTERNET:
                 continue
-            host_num = np.random.randint(size)
+            host_num = self.rng.integers(size)
             host = self.hosts[(subnet, host_num)]
             self._update_host_to_vulnerable(host)
+            self._update_vulnerability_matrices(
+                subnet_offsets[subnet] + host_num, host
+            )
             vulnerable_subnets.add(subnet)
 
-    def _host_is_vulnerable(self, host, access_level=u.USER_ACCESS):
-        for e_def in self.exploits.values():
-            if self._host_is_vulnerable_to_exploit(host, e_def):
-                if e_def[u.EXPLOIT_ACCESS] >= access_level:
-                    return True
-                for pe_def in self.privescs.values():
-                    if self._host_is_vulnerable_to_privesc(host, pe_def):
-                        return True
-        return False
-
-    def _host_is_vulnerable_to_exploit(self, host, exploit_def):
-        e_srv = exploit_def[u.EXPLOIT_SERVICE]
-        e_os = exploit_def[u.EXPLOIT_OS]
-        if not host.services[e_srv]:
-            return False
-        return e_os is None or host.os[e_os]
-
-    def _host_is_vulnerable_to_privesc(self, host, privesc_def):
-        pe_proc = privesc_def[u.PRIVESC_PROCESS]
-        pe_os = privesc_def[u.PRIVESC_OS]
-        if not host.processes[pe_proc]:
-            return False
-        return pe_os is None or host.os[pe_os]
+    def _update_vulnerability_matrices(self, host_num, host):
+        """Recompute vulnerability matrices row for modified host """
+        e_vuln, pe_vuln = self._vulnerability_matrices([host])
+        self._e_vuln[host_num] = e_vuln[0]
+        self._pe_vuln[host_num] = pe_vuln[0]
+
+    def _vulnerability_matrices(self, hosts):
+        """Get which exploits and privescs each host is vulnerable to.
+
+        Parameters
+        ----------
+        hosts : list[Host]
+            the hosts
+
+        Returns
+        -------
+        np.ndarray
+            (len(hosts), num_exploits) bool array, True if host is
+            vulnerable to exploit
+        np.ndarray
+            (len(hosts), num_privescs) bool array, True if host is
+            vulnerable to privesc
+        """
+        host_srvs = np.array(
+            [[h.services[srv] for srv in self.services] for h in hosts],
+            dtype=bool
+        ).reshape(len(hosts), len(self.services))
+        host_procs = np.array(
+            [[h.processes[proc] for proc in self.processes] for h in hosts],
+            dtype=bool
+        ).reshape(len(hosts), len(self.processes))
+        # extra always True column for actions that work on any OS (None)
+        host_os = np.ones((len(hosts), len(self.os)+1), dtype=bool)
+        host_os[:, :-1] = np.array(
+            [[h.os[os] for os in self.os] for h in hosts], dtype=bool
+        ).reshape(len(hosts), len(self.os))
+
+        e_vuln = host_srvs[:, self._e_srv_idx] & host_os[:, self._e_os_idx]
+        pe_vuln = (
+            host_procs[:, self._pe_proc_idx] & host_os[:, self._pe_os_idx]
+        )
+        return e_vuln, pe_vuln
+
+    def _hosts_vulnerable(self, e_vuln, pe_vuln, access_levels):
+        """Get whether each host can be compromised to given access levels.
+
+        A host can be compromised if it is vulnerable to an exploit that
+        gives the access level, or is vulnerable to any exploit and any
+        privesc.
+
+        Parameters
+        ----------
+        e_vuln : np.ndarray
+            host exploit vulnerability matrix
+        pe_vuln : np.ndarray
+            host privesc vulnerability matrix
+        access_levels : list[int]
+            required access levels
+
+        Returns
+        -------
+        list[np.ndarray]
+            for each access level, 1D bool array which is True if host can
+            be compromised
+        """
+        # pack exploit vulnerabilities of each host into a bitset, so
+        # checking each access level is an AND over num_exploits/8 bytes
+        e_bits = np.packbits(e_vuln, axis=1)
+        e_and_pe = e_bits.any(axis=1) & pe_vuln.any(axis=1)
+        return [
+            (e_bits & self._e_access_bits[level]).any(axis=1) | e_and_pe
+            for level in access_levels
+        ]
 
     def _update_host_to_vulnerable(self, host, access_level=u.USER_ACCESS):
         """Update host config so it's vulnerable to at least one exploit """
@@ -768,20 +930,17 @@ class ScenarioGenerator:
         # choose an exploit randomly and make host vulnerable to it
         if not os_constraint:
             # can change host OS, so all exploits valid
-            valid_e = list(self.exploits.values())
+            valid_e = self._e_defs
         else:
             # exploits must match OS of host, or be OS agnostic
             # since cannot change host OS
-            valid_e = []
-            for e_def in self.exploits.values():
-                e_os = e_def[u.EXPLOIT_OS]
-                if e_os is None or host.os[e_os]:
-                    valid_e.append(e_def)
+            valid = np.flatnonzero(self._valid_os(host, self._e_os_idx))
+            valid_e = [self._e_defs[i] for i in valid]
 
             if len(valid_e) == 0:
                 return False, None
 
-        e_def = np.random.choice(valid_e)
+        e_def = valid_e[self.rng.integers(len(valid_e))]
         host.services[e_def[u.EXPLOIT_SERVICE]] = True
         if e_def[u.EXPLOIT_OS] is not None and not os_constraint:
             self._update_host_os(host, e_def[u.EXPLOIT_OS])
@@ -792,24 +951,26 @@ class ScenarioGenerator:
         # choose an exploit randomly and make host vulnerable to it
         if not os_constraint:
             # no OS constraint
-            valid_pe = list(self.privescs.values())
+            valid_pe = self._pe_defs
         else:
-            valid_pe = []
-            for pe_def in self.privescs.values():
-                pe_os = pe_def[u.PRIVESC_OS]
-                if pe_os is None or host.os[pe_os]:
-                    valid_pe.append(pe_def)
+            valid = np.flatnonzero(self._valid_os(host, self._pe_os_idx))
+            valid_pe = [self._pe_defs[i] for i in valid]
 
             if len(valid_pe) == 0:
                 return False, None
 
-        pe_def = np.random.choice(valid_pe)
+        pe_def = valid_pe[self.rng.integers(len(valid_pe))]
         host.processes[pe_def[u.PRIVESC_PROCESS]] = True
         if pe_def[u.PRIVESC_OS] is not None and not os_constraint:
             self._update_host_os(host, pe_def[u.PRIVESC_OS])
 
         return True, pe_def
 
+    def _valid_os(self, host, os_idx):
+        """Get mask of which OS indices (incl. None) match host's OS """
+        host_os = np.array([host.os[os] for os in self.os] + [True])
+        return host_os[os_idx]
+
     def _update_host_os(self, host, os):
         # must set all to false first, so only one host OS is true
         for os_name in host.os.keys():
@@ -843,48 +1004,68 @@ class ScenarioGenerator:
         than restrictiveness parameter.
         """
         num_subnets = len(self.subnets)
-        firewall = {}
-
-        # find services running on each subnet that are vulnerable
-        subnet_services = {}
-        subnet_services[u.INTERNET] = set()
-        for host_addr, host in self.hosts.items():
-            subnet = host_addr[0]
-            if subnet not in subnet_services:
-                subnet_services[subnet] = set()
-            for e_def in self.exploits.values():
-                if self._host_is_vulnerable_to_exploit(host, e_def):
-                    subnet_services[subnet].add(e_def[u.EXPLOIT_SERVICE])
-
-        for src in range(num_subnets):
-            for dest in range(num_subnets):
-                if src == dest or not self.topology[src][dest]:
-                    # no inter subnet connection so no firewall
-                    continue
-                elif src > SENSITIVE and dest > SENSITIVE:
-                    # all services allowed between user subnets
-                    allowed = set(self.services)
-                    firewall[(src, dest)] = allowed
-                    continue
-                # else src and dest in different zones => block services based
-                # on restrictiveness
-                dest_avail = subnet_services[dest].copy()
-                if len(dest_avail) < restrictiveness:
-                    # restrictiveness not limiting allowed traffic, all
-                    # services allowed
-                    firewall[(src, dest)] = dest_avail.copy()
-                    continue
-                # add at least one service to allowed service
-                dest_allowed = np.random.choice(list(dest_avail))
+
+        # find services running on each subnet that are vulnerable, hosts
+        # are in subnet order so reduce over each subnet's block of rows
+        # (internet subnet has no hosts)
+        subnet_e_vuln = np.zeros(
+            (num_subnets, len(self.exploits)), dtype=bool
+        )
+        subnet_starts = np.cumsum([0] + self.subnets[1:-1])
+        subnet_e_vuln[1:] = np.logical_or.reduceat(
+            self._e_vuln, subnet_starts, axis=0
+        )
+        # exploit -> service one-hot, so boolean matmul gives for each
+        # subnet whether any exploit of each service works on subnet
+        e_srv = np.zeros((len(self.exploits), len(self.services)), dtype=bool)
+        e_srv[np.arange(len(self.exploits)), self._e_srv_idx] = True
+        subnet_services = subnet_e_vuln @ e_srv
+
+        # indices of available services on each subnet, sampled without
+        # replacement below when more than restrictiveness available
+        subnet_avail = [np.flatnonzero(srvs) for srvs in subnet_services]
+
+        # pairs of different subnets that are connected and so need a
+        # firewall, and which of these are between user subnets
+        connected = self._connected_subnets()
+        is_user = np.arange(num_subnets) > SENSITIVE
+        user_pairs = connected & is_user[:, None] & is_user[None, :]
+
+        # dense (src, dest, service) mask of allowed services
+        firewall_mask = np.zeros(
+            (num_subnets, num_subnets, len(self.services)), dtype=bool
+        )
+        # all services allowed between user subnets
+        firewall_mask[user_pairs] = True
+        # else src and dest in different zones => block services based on
+        # restrictiveness (pairs in row major order)
+        for src, dest in np.argwhere(connected & ~user_pairs).tolist():
+            dest_avail = subnet_avail[dest]
+            if len(dest_avail) > restrictiveness:
                 # for dest subnet choose available services upto
-                # restrictiveness limit or all services
-                dest_avail.remove(dest_allowed)
-                allowed = set()
-                allowed.add(dest_allowed)
-                while len(allowed) < restrictiveness:
-                    dest_allowed = np.random.choice(list(dest_avail))
-                    if dest_allowed not in allowed:
-                        allowed.add(dest_allowed)
-                        dest_avail.remove(dest_allowed)
-                firewall[(src, dest)] = allowed
-        self.firewall = firewall
+                # restrictiveness limit
+                dest_avail = self.rng.choice(
+                    dest_avail, size=restrictiveness, replace=False
+                )
+            # else restrictiveness not limiting allowed traffic, all
+            # services allowed
+            firewall_mask[src, dest, dest_avail] = True
+        self.firewall = self._firewall_dict(firewall_mask)
+
+    def _connected_subnets(self):
+        """Get bool matrix of which pairs of different subnets are connected
+        """
+        connected = np.asarray(self.topology, dtype=bool).copy()
+        np.fill_diagonal(connected, False)
+        return connected
+
+    def _firewall_dict(self, firewall_mask):
+        """Get (src, dest) -> set of allowed services mapping for each
+        connected pair of subnets from dense firewall mask
+        """
+        pairs = np.argwhere(self._connected_subnets())
+        allowed = firewall_mask[pairs[:, 0], pairs[:, 1]].tolist()
+        return {
+            (src, dest): set(itertools.compress(self.services, srv_allowed))
+            for (src, dest), srv_allowed in zip(pairs.tolist(), allowed)
+        }
@@ -1,5 +1,4 @@
 import os
-import yaml
 import os.path as osp
 
 
@@ -74,8 +73,18 @@ def load_yaml(file_path):
     ------
     Exception
         if theres an issue loading file. """
-    with open(file_path) as fin:
-        content = yaml.load(fin, Loader=yaml.FullLoader)
+    # imported here since PyYAML is slow to import and only needed when
+    # loading scenario files
+    import yaml
+    # use libyaml C bindings when available, much faster than pure python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(file_path) as fin:
+            content = yaml.load(fin, Loader=loader)
+    except yaml.constructor.ConstructorError:
+        # file uses tags not supported by safe loader (e.g. python tuples)
+        with open(file_path) as fin:
+            content = yaml.load(fin, Loader=yaml.FullLoader)
     return content
 
 
@@ -32,7 +32,7 @@ from nasim.scenarios.benchmark import AVAIL_BENCHMARKS
 def describe_scenarios(output=None):
     rows = []
     headers = None
-    for name in AVAIL_BENCHMARKS:
+    for name in sorted(AVAIL_BENCHMARKS):
         scenario = make_benchmark_scenario(name, seed=0)
         des = scenario.get_description()
         if headers is None:
@@ -75,7 +75,7 @@ def collate_results(results):
 def output_results(results, output=None):
     headers = ["Scenario Name", "Steps", "Total Reward"]
     rows = []
-    for name in AVAIL_BENCHMARKS:
+    for name in sorted(AVAIL_BENCHMARKS):
         rows.append([
             name, *results[name].get_formatted_summary()
         ])
@@ -93,7 +93,7 @@ def output_results(results, output=None):
 
 def run_random_benchmark(num_cpus=1, num_seeds=10, output=None):
     run_args_list = []
-    for name in AVAIL_BENCHMARKS:
+    for name in sorted(AVAIL_BENCHMARKS):
         for seed in range(num_seeds):
             run_args_list.append((name, seed))
 
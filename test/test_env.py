@@ -1,8 +1,12 @@
 """Runs some general tests on environment"""
 
+import copy
+import pickle
+
 import pytest
 
 import nasim
+from nasim.scenarios.utils import load_yaml
 from nasim.scenarios.benchmark import \
     AVAIL_GEN_BENCHMARKS, AVAIL_STATIC_BENCHMARKS
 
@@ -71,3 +75,96 @@ def test_get_minumum_hops(scenario, expected_value):
     env.reset()
     actual_value = env.get_minimum_hops()
     assert actual_value == expected_value
+
+
+@pytest.mark.parametrize("scenario", ["tiny", "small"])
+def test_generate_random_initial_state(scenario):
+    env = nasim.make_benchmark(scenario, seed=0)
+    state = env.generate_random_initial_state()
+    for host_addr, host in state.hosts:
+        readable = host.readable()
+        assert readable["Address"] == host_addr
+        assert sum(readable[os] for os in env.scenario.os) == 1
+
+
+@pytest.mark.parametrize("flat_actions", [True, False])
+def test_env_pickle_and_copy(flat_actions):
+    env = nasim.make_benchmark("tiny", seed=0, flat_actions=flat_actions)
+    env.reset()
+    a = env.action_space.sample()
+    expected = env.action_space.get_action(a)
+    for env_copy in (pickle.loads(pickle.dumps(env)), copy.deepcopy(env)):
+        actual = env_copy.action_space.get_action(a)
+        assert actual == expected
+        assert actual is not expected
+
+
+def test_seeded_generated_benchmark_rollout_reproducible():
+    """Tests seeding a generated benchmark also makes action outcomes
+    reproducible, including when the scenario is cached
+    """
+    rollouts = []
+    for _ in range(2):
+        env = nasim.make_benchmark("tiny-gen", seed=3)
+        env.reset()
+        rewards = []
+        for a in range(100):
+            _, r, _, _, _ = env.step(a % env.action_space.n)
+            rewards.append(r)
+        rollouts.append(rewards)
+    assert rollouts[0] == rollouts[1]
+
+
+def test_step_info_host_features_are_dicts():
+    """Tests services, os and processes in step info are plain dicts """
+    env = nasim.make_benchmark("tiny", flat_actions=False)
+    env.reset()
+    a_types = env.action_space.action_types
+    for a_type in ("ServiceScan", "OSScan"):
+        a_idx = [t.__name__ for t in a_types].index(a_type)
+        # target first host in DMZ subnet (subnet index 0 in action vector)
+        _, _, _, _, info = env.step([a_idx, 0, 0, 0, 0, 0])
+        assert info["success"]
+        for key in ("services", "os", "processes"):
+            assert type(info[key]) is dict
+
+
+@pytest.mark.parametrize("fully_obs", [True, False])
+def test_subnet_scan_info(fully_obs):
+    """Tests subnet scan info only includes discovered hosts in partially
+    observable mode
+    """
+    env = nasim.make_benchmark("tiny", fully_obs=fully_obs)
+    env.reset()
+    actions = env.action_space.actions
+    # compromise DMZ host so it can be used to scan its subnet, retrying
+    # since exploits may fail at random
+    exploits = [
+        i for i, a in enumerate(actions)
+        if a.is_exploit() and a.target == (1, 0)
+    ]
+    compromised = False
+    while not compromised:
+        for a_idx in exploits:
+            _, _, _, _, info = env.step(a_idx)
+            compromised |= info["success"]
+    a_idx = next(
+        i for i, a in enumerate(actions)
+        if a.is_subnet_scan() and a.target == (1, 0)
+    )
+    _, _, _, _, info = env.step(a_idx)
+    assert info["success"]
+    if fully_obs:
+        assert info["discovered"] == {}
+        assert info["newly_discovered"] == {}
+    else:
+        assert info["discovered"][(2, 0)]
+        assert info["newly_discovered"][(2, 0)]
+        assert not info["newly_discovered"][(1, 0)]
+
+
+def test_load_yaml_full_loader_tags(tmp_path):
+    """Tests yaml files using python tags supported by FullLoader load """
+    path = tmp_path / "tags.yaml"
+    path.write_text("address: !!python/tuple [1, 0]\nvalue: 10\n")
+    assert load_yaml(str(path)) == {"address": (1, 0), "value": 10}
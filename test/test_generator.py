@@ -5,6 +5,7 @@ using different parameters to check no exceptions occur
 import pytest
 
 import nasim
+from nasim.scenarios import make_benchmark_scenario
 from nasim.scenarios.benchmark import \
     AVAIL_GEN_BENCHMARKS
 
@@ -16,3 +17,39 @@ def test_generator(scenario, seed):
     seeds, checking for any errors
     """
     nasim.make_benchmark(scenario, seed=seed)
+
+
+def test_generator_benchmark_params_not_modified():
+    """Tests making a generated benchmark does not change its params """
+    params = dict(AVAIL_GEN_BENCHMARKS["tiny-gen"])
+    nasim.make_benchmark("tiny-gen", seed=7)
+    assert dict(AVAIL_GEN_BENCHMARKS["tiny-gen"]) == params
+    assert "seed" not in params
+
+
+def test_generator_benchmark_params_read_only():
+    """Tests generated benchmark definitions cannot be modified in place """
+    with pytest.raises(TypeError):
+        AVAIL_GEN_BENCHMARKS["tiny-gen"]["seed"] = 0
+    with pytest.raises(TypeError):
+        AVAIL_GEN_BENCHMARKS["tiny-gen"] = {}
+
+
+def test_generator_cached_scenario_is_copy():
+    """Tests repeat seeded generation returns independent scenario copies,
+    unless copy=False is used to get the shared cached scenario
+    """
+    s1 = make_benchmark_scenario("tiny-gen", seed=11)
+    s2 = make_benchmark_scenario("tiny-gen", seed=11)
+    assert s1 is not s2
+    assert s1.get_description() == s2.get_description()
+    addr = next(iter(s1.hosts))
+    s1.hosts[addr].value += 100
+    s1.firewall.clear()
+    s3 = make_benchmark_scenario("tiny-gen", seed=11)
+    assert s3.hosts[addr].value == s2.hosts[addr].value
+    assert s3.firewall == s2.firewall
+
+    shared = make_benchmark_scenario("tiny-gen", seed=11, copy=False)
+    assert shared is make_benchmark_scenario("tiny-gen", seed=11, copy=False)
+    assert shared is not s3
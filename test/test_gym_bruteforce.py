@@ -18,7 +18,7 @@ def test_gym_reload():
     reload(gym)
     reload(nasim)
 
-@pytest.mark.parametrize("scenario", AVAIL_BENCHMARKS)
+@pytest.mark.parametrize("scenario", sorted(AVAIL_BENCHMARKS))
 @pytest.mark.parametrize("po", ['', 'PO'])
 @pytest.mark.parametrize("obs", ['', '2D'])
 @pytest.mark.parametrize("actions", ['', 'VA'])